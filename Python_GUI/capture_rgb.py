@@ -5,12 +5,13 @@ Captures RGB video from external USB webcam using OpenCV.
 Optimized with threading and hardware configurations for low latency.
 """
 
+import sys
 import cv2
+import numpy as np
 import threading
-import queue
 import time
 import logging
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -19,11 +20,13 @@ logger = logging.getLogger(__name__)
 class RGBCameraCapture:
     """RGB camera capture using OpenCV with threading for low latency."""
     
-    def __init__(self, camera_index: int = 0, target_fps: int = 30):
-        """Initialize RGB camera capture."""
+    def __init__(self, camera_index: int = 0, target_fps: int = 30, backend: Optional[int] = None):
+        """Initialize RGB camera capture (backend=None picks one per platform)."""
         self.camera_index = camera_index
         self.target_fps = target_fps
         self.frame_interval = 1.0 / target_fps
+        self.backend = backend
+        self.max_stale_grabs = 3  # Upper bound on buffered frames skipped per loop
         
         # Camera device
         self.camera = None
@@ -31,7 +34,21 @@ class RGBCameraCapture:
         # Threading components for low latency
         self.running = False
         self.capture_thread = None
-        self.frame_queue = queue.Queue(maxsize=2)  # Prevent stale frames
+        # Single-slot handoff: attribute assignment is atomic under the GIL, so
+        # publishing and taking a frame need no lock. Newer frames overwrite older ones.
+        self._latest_frame = None
+        self.frame_counter = 0  # Incremented per published frame so consumers can skip repeats
+        self.frame_callback: Optional[Callable[[], None]] = None  # Called from the capture thread
+        
+        # Reusable frame buffers filled by camera.read() (sized from the first frame)
+        self._buf_pool = []
+        self._buf_idx = 0
+        
+        # Display-sized frames produced by the capture thread (see get_display_frame)
+        self.display_size: Optional[Tuple[int, int]] = None  # (width, height) requested by the GUI
+        self._latest_display_frame = None
+        self._display_pool = []
+        self._display_idx = 0
         
         logger.info(f"RGBCameraCapture initialized with camera_index={camera_index}, target_fps={target_fps}")
     
@@ -54,6 +71,14 @@ class RGBCameraCapture:
         logger.info("RGB camera capture started")
         return True
     
+    def probe(self) -> bool:
+        """Check whether the camera opens, without starting capture (the device is released again)."""
+        camera = self._open_camera()
+        if camera is None:
+            return False
+        camera.release()
+        return True
+    
     def stop(self):
         """Stop RGB camera capture."""
         logger.info("Stopping RGB camera capture...")
@@ -71,10 +96,10 @@ class RGBCameraCapture:
     def _initialize_camera(self) -> bool:
         """Initialize the RGB camera hardware."""
         try:
-            # DirectShow backend for webcam compatibility
-            self.camera = cv2.VideoCapture(self.camera_index, cv2.CAP_DSHOW)
+            # Hardware-accelerated MJPEG decode where available (DirectShow fallback)
+            self.camera = self._open_camera()
             
-            if not self.camera.isOpened():
+            if self.camera is None:
                 logger.error(f"Failed to open camera at index {self.camera_index}")
                 return False
             
@@ -100,6 +125,10 @@ class RGBCameraCapture:
                 self.camera.release()
                 return False
             
+            # 3 slots: one being filled, one published, one the GUI may still hold
+            self._buf_pool = [np.empty_like(frame) for _ in range(3)]
+            self._buf_idx = 0
+            
             logger.info(f"RGB camera initialized - Frame size: {frame.shape}")
             return True
             
@@ -110,44 +139,100 @@ class RGBCameraCapture:
                 self.camera = None
             return False
     
+    def _open_camera(self) -> Optional[cv2.VideoCapture]:
+        """Open the camera on the preferred backend with hardware decode requested (None if none opens it)."""
+        if self.backend is not None:
+            backends = [self.backend]
+        elif sys.platform == 'win32':
+            # Media Foundation can use the GPU MJPEG decoder; DirectShow decodes on the CPU
+            backends = [cv2.CAP_MSMF, cv2.CAP_DSHOW]
+        else:
+            backends = [cv2.CAP_V4L2]
+        
+        # Open-time params need OpenCV >= 4.5.2
+        params = []
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        
+        for backend in backends:
+            # Some backends/builds reject the open params - retry plain before moving on
+            for open_params in ([params, []] if params else [[]]):
+                camera = self._try_open(backend, open_params)
+                if camera is not None:
+                    logger.info(f"RGB camera opened with {camera.getBackendName()} backend"
+                                f"{'' if open_params else ' (no hardware acceleration)'}")
+                    return camera
+                if open_params:
+                    logger.warning(f"{self._backend_name(backend)} backend rejected camera {self.camera_index} "
+                                   f"with hardware acceleration - retrying without")
+            logger.warning(f"{self._backend_name(backend)} backend could not open camera {self.camera_index}")
+        
+        return None
+    
+    def _try_open(self, backend: int, params: list) -> Optional[cv2.VideoCapture]:
+        """Open the camera on one backend, or return None if it does not open."""
+        try:
+            if params:
+                camera = cv2.VideoCapture(self.camera_index, backend, params)
+            else:
+                camera = cv2.VideoCapture(self.camera_index, backend)
+        except cv2.error as e:
+            logger.debug(f"VideoCapture raised on {self._backend_name(backend)} backend: {e}")
+            return None
+        if camera.isOpened():
+            return camera
+        camera.release()
+        return None
+    
+    @staticmethod
+    def _backend_name(backend: int) -> str:
+        """Readable name for a cv2.CAP_* backend id."""
+        try:
+            return cv2.videoio_registry.getBackendName(backend)
+        except (AttributeError, cv2.error):
+            return str(backend)
+    
     def _capture_loop(self):
         """Main capture loop running in separate thread."""
         logger.info("RGB camera capture loop started")
         
+        # No software pacing: grab() blocks until the driver delivers the next
+        # frame at CAP_PROP_FPS, so sleeping here would only add latency/jitter
         while self.running:
-            loop_start = time.time()
-            
             try:
                 if not self.camera or not self.camera.isOpened():
                     logger.error("Camera not available in capture loop")
                     break
                 
-                # Capture frame
-                ret, frame = self.camera.read()
+                # Skip to the freshest frame, then decode it into the next pooled
+                # buffer (no per-frame allocation)
+                ret, frame = False, None
+                if self._grab_latest():
+                    ret, frame = self.camera.retrieve(self._buf_pool[self._buf_idx])
                 
                 if not ret or frame is None:
                     logger.warning("Failed to capture frame from RGB camera")
                     time.sleep(0.1)
                     continue
+                self._buf_idx = (self._buf_idx + 1) % len(self._buf_pool)
+                
+                # Frames stay in OpenCV's native BGR layout; the GUI wraps them
+                # with QImage.Format_BGR888 so no per-frame channel swap is needed
                 
-                # Convert BGR to RGB for consistent display
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # Resize for the GUI here so its thread only has to wrap the buffer
+                display_frame = None
+                if self.display_size is not None:
+                    display_frame = self._resize_for_display(frame)
                 
-                # Put frame in queue (non-blocking)
-                try:
-                    self.frame_queue.put(rgb_frame, block=False)
-                except queue.Full:
-                    # Remove oldest frame if queue is full (prevent stale frames)
-                    try:
-                        self.frame_queue.get_nowait()
-                        self.frame_queue.put(rgb_frame, block=False)
-                    except queue.Empty:
-                        pass
+                # Publish frame (overwrites any frame the GUI has not consumed yet);
+                # the counter goes last so it never announces an unpublished frame
+                self._latest_frame = frame
+                self._latest_display_frame = display_frame
+                self.frame_counter += 1
                 
-                # Frame rate control for consistent timing
-                elapsed = time.time() - loop_start
-                sleep_time = max(0.001, self.frame_interval - elapsed)
-                time.sleep(sleep_time)
+                # Notify the consumer (e.g. a Qt signal emit) that a frame is ready
+                if self.frame_callback is not None:
+                    self.frame_callback()
                 
             except Exception as e:
                 logger.error(f"Error in RGB capture loop: {e}")
@@ -155,12 +240,66 @@ class RGBCameraCapture:
         
         logger.info("RGB camera capture loop ended")
     
+    def _grab_latest(self) -> bool:
+        """
+        Grab frames until the newest one is reached, bounded by max_stale_grabs.
+        
+        grab() returns immediately for frames the driver already buffered and
+        blocks only when waiting for a new one, so a slow grab means the
+        freshest frame is in hand. Only the last grabbed frame gets decoded.
+        """
+        grabbed = False
+        for _ in range(self.max_stale_grabs):
+            grab_start = time.perf_counter()
+            if not self.camera.grab():
+                break
+            grabbed = True
+            if time.perf_counter() - grab_start > self.frame_interval / 2:
+                break
+        return grabbed
+    
+    def _resize_for_display(self, frame: np.ndarray) -> np.ndarray:
+        """Resize a frame to fit display_size (aspect ratio kept) into a pooled buffer."""
+        target_w, target_h = self.display_size
+        height, width = frame.shape[:2]
+        scale = min(target_w / width, target_h / height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        
+        # 3 slots like the capture pool; reallocated only when the display size changes
+        if not self._display_pool or self._display_pool[0].shape[1::-1] != size:
+            self._display_pool = [np.empty((size[1], size[0], frame.shape[2]), dtype=frame.dtype) for _ in range(3)]
+            self._display_idx = 0
+        out = self._display_pool[self._display_idx]
+        self._display_idx = (self._display_idx + 1) % len(self._display_pool)
+        cv2.resize(frame, size, dst=out, interpolation=cv2.INTER_AREA)
+        return out
+    
     def get_latest_frame(self) -> Optional:
-        """Get the latest RGB frame."""
-        try:
-            return self.frame_queue.get_nowait()
-        except queue.Empty:
-            return None
+        """Get the latest camera frame (BGR channel order), or None if no new frame."""
+        frame = self._latest_frame
+        self._latest_frame = None
+        return frame
+    
+    def get_display_frame(self, target_size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Get the latest frame resized to fit target_size (width, height), or None if none yet.
+        
+        The resize runs in the capture thread, so a changed target_size takes
+        effect from the next captured frame. Frames are C-contiguous uint8
+        (H, W, 3) pool buffers, ready to wrap in a QImage without a copy.
+        Repeated calls return the same frame; use get_frame_counter to skip
+        frames already shown.
+        """
+        self.display_size = target_size
+        return self._latest_display_frame
+    
+    def set_frame_callback(self, callback: Optional[Callable[[], None]]):
+        """Set a callable invoked from the capture thread after each new frame (None to clear)."""
+        self.frame_callback = callback
+    
+    def get_frame_counter(self) -> int:
+        """Get the number of frames published so far (changes only when a new frame arrives)."""
+        return self.frame_counter
     
     def is_running(self) -> bool:
         """Check if camera is running."""
@@ -2,16 +2,20 @@
 HT301 Thermal Camera Capture Module
 
 Optimized thermal camera interface with temperature range filtering.
-Configuration controlled from main.py for easy adjustment.
+Configuration controlled from config.json for easy adjustment.
 """
 
 import sys
 import os
+import threading
+import time
 import logging
-from typing import Optional, Tuple, Dict
+from typing import Callable, Optional, Tuple, Dict
 import numpy as np
 import cv2
 
+from thermal_kernels import NUMBA_AVAILABLE, min_max_scan, render_thermal, warmup_kernels
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -37,8 +41,35 @@ class ThermalCameraCapture:
         self.camera = None
         self.target_fps = target_fps
         
+        # Capture thread publishes the latest temperature frame for all consumers
+        self.capture_thread = None
+        self._camera_lock = threading.Lock()  # Serializes sensor access (read vs. calibrate)
+        # Single-slot handoff: attribute assignment is atomic under the GIL, so
+        # the latest frames are published and read without a lock
+        self._latest_temp_frame = None
+        self.frame_counter = 0  # Incremented per published frame so consumers can skip repeats
+        self.frame_callback: Optional[Callable[[], None]] = None  # Called from the capture thread
+        
+        # Guards settings mutated from the GUI thread; frames snapshot them once
+        self._settings_lock = threading.Lock()
+        
+        # Reusable temperature buffers filled by the capture thread (sized on first frame)
+        self._temp_buf_pool = []
+        self._temp_buf_idx = 0
+        
+        # Double-buffered RGB display output handed to the GUI (sized on first frame)
+        self._out_buffers = []
+        self._out_idx = 0
+        
+        # Display-sized frames produced by the capture thread (see get_display_frame)
+        self.display_size: Optional[Tuple[int, int]] = None  # (width, height) requested by the GUI
+        self._latest_display_frame = None
+        self._display_pool = []
+        self._display_idx = 0
+        
         # Display settings
         self.colormap = cv2.COLORMAP_PLASMA
+        self._palette_lut = self._build_palette_lut(self.colormap)
         self.auto_exposure = True
         self.temp_min = 0
         self.temp_max = 50
@@ -47,7 +78,7 @@ class ThermalCameraCapture:
         self.show_min_max = True
         self.last_min_max_data = None
         
-        # Temperature filter configuration (from main.py)
+        # Temperature filter configuration (from config.json)
         self.enable_temp_filter = temp_filter_enabled
         self.filter_temp_min = temp_filter_min
         self.filter_temp_max = temp_filter_max
@@ -71,7 +102,10 @@ class ThermalCameraCapture:
             self.camera = irpythermal.Camera()
             logger.info(f"HT301 camera initialized: {self.camera.width}x{self.camera.height}")
             
+            # Start capture thread
             self.running = True
+            self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self.capture_thread.start()
             return True
             
         except Exception as e:
@@ -85,6 +119,9 @@ class ThermalCameraCapture:
             
         logger.info("Stopping HT301 thermal camera...")
         self.running = False
+        if self.capture_thread:
+            self.capture_thread.join(timeout=2.0)
+            self.capture_thread = None
         
         if self.camera:
             try:
@@ -93,9 +130,110 @@ class ThermalCameraCapture:
                 logger.warning(f"Warning during camera release: {e}")
                 
         self.camera = None
+        self._latest_temp_frame = None
+        self._latest_display_frame = None
+        self._temp_buf_pool = []
+        self._out_buffers = []
+        self._display_pool = []
         logger.info("HT301 thermal camera stopped")
     
-    def apply_temperature_filter(self, temp_frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _capture_loop(self):
+        """Read the sensor continuously and publish the latest temperature frame."""
+        logger.info("HT301 capture loop started")
+        
+        while self.running:
+            try:
+                with self._camera_lock:
+                    ret, frame = self.camera.read()
+                    if ret:
+                        info, temp_lut = self.camera.info()
+                
+                if not ret:
+                    logger.warning("Failed to capture frame from HT301 camera")
+                    time.sleep(0.1)
+                    continue
+                
+                # 3 slots: one being filled, one published, one a consumer may still hold
+                if not self._temp_buf_pool:
+                    self._temp_buf_pool = [np.empty(frame.shape, dtype=temp_lut.dtype) for _ in range(3)]
+                    self._temp_buf_idx = 0
+                    # Compile kernels here, before the first frame reaches the GUI thread
+                    warmup_kernels(temp_lut.dtype)
+                
+                # LUT lookup into the next pooled buffer (no per-frame allocation).
+                # mode='clip' lets np.take write into out directly; 'raise' buffers it.
+                temp_frame = self._temp_buf_pool[self._temp_buf_idx]
+                np.take(temp_lut, frame, out=temp_frame, mode='clip')
+                self._temp_buf_idx = (self._temp_buf_idx + 1) % len(self._temp_buf_pool)
+                
+                # Newer frames overwrite older ones - consumers only need the latest
+                self._latest_temp_frame = temp_frame
+                
+                # Render and resize for the GUI here so its thread only has to wrap the buffer
+                display_frame = None
+                if self.display_size is not None:
+                    display_frame = self.get_latest_frame()
+                    if display_frame is not None:
+                        display_frame = self._resize_for_display(display_frame)
+                
+                # Counter goes last so it never announces an unpublished frame
+                self._latest_display_frame = display_frame
+                self.frame_counter += 1
+                
+                # Notify the consumer (e.g. a Qt signal emit) that a frame is ready
+                if self.frame_callback is not None:
+                    self.frame_callback()
+                
+            except Exception as e:
+                logger.error(f"Error in HT301 capture loop: {e}")
+                break
+        
+        logger.info("HT301 capture loop ended")
+    
+    def _get_latest_temp_frame(self) -> Optional[np.ndarray]:
+        """Get the most recent temperature frame published by the capture thread."""
+        return self._latest_temp_frame
+    
+    def _resize_for_display(self, frame: np.ndarray) -> np.ndarray:
+        """Resize a frame to fit display_size (aspect ratio kept) into a pooled buffer."""
+        target_w, target_h = self.display_size
+        height, width = frame.shape[:2]
+        scale = min(target_w / width, target_h / height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        
+        # 3 slots like the capture pool; reallocated only when the display size changes
+        if not self._display_pool or self._display_pool[0].shape[1::-1] != size:
+            self._display_pool = [np.empty((size[1], size[0], frame.shape[2]), dtype=frame.dtype) for _ in range(3)]
+            self._display_idx = 0
+        out = self._display_pool[self._display_idx]
+        self._display_idx = (self._display_idx + 1) % len(self._display_pool)
+        cv2.resize(frame, size, dst=out, interpolation=cv2.INTER_AREA)
+        return out
+    
+    @staticmethod
+    def _build_palette_lut(colormap: int) -> np.ndarray:
+        """Build a (256, 3) RGB lookup table for a cv2 colormap (once per palette change)."""
+        ramp = np.arange(256, dtype=np.uint8).reshape(1, 256)
+        bgr_lut = cv2.applyColorMap(ramp, colormap).reshape(256, 3)
+        return np.ascontiguousarray(bgr_lut[:, ::-1])  # Swap to RGB once instead of per frame
+    
+    @staticmethod
+    def _histogram_percentiles(temp_frame: np.ndarray, value_range: Tuple[float, float],
+                               lower: float = 1.0, upper: float = 99.0, bins: int = 1024) -> Tuple[float, float]:
+        """
+        Approximate percentiles from a fixed-range histogram (O(N), no sort).
+        
+        Values outside value_range are ignored by np.histogram, so the filter
+        range can be passed directly instead of gathering the valid pixels first.
+        """
+        hist, edges = np.histogram(temp_frame, bins=bins, range=value_range)
+        cdf = np.cumsum(hist)
+        total = cdf[-1]
+        lo_idx = np.searchsorted(cdf, total * lower / 100.0)
+        hi_idx = np.searchsorted(cdf, total * upper / 100.0)
+        return float(edges[lo_idx]), float(edges[hi_idx + 1])
+    
+    def apply_temperature_filter(self, temp_frame: np.ndarray) -> np.ndarray:
         """
         Apply temperature range filter to the thermal frame.
         
@@ -103,23 +241,15 @@ class ThermalCameraCapture:
             temp_frame: Raw temperature data array
             
         Returns:
-            Tuple of (filtered_temp_frame, mask) where:
-            - filtered_temp_frame: Temperature data with out-of-range values set to NaN
-            - mask: Boolean mask indicating which pixels are within range
+            Boolean mask indicating which pixels are within range
+            (index temp_frame[mask] for reductions instead of a NaN-filled copy)
         """
         if not self.enable_temp_filter:
-            # No filtering - return original data with all-True mask
-            mask = np.ones_like(temp_frame, dtype=bool)
-            return temp_frame, mask
+            # No filtering - all-True mask
+            return np.ones_like(temp_frame, dtype=bool)
         
         # Create mask for pixels within the temperature range
-        mask = (temp_frame >= self.filter_temp_min) & (temp_frame <= self.filter_temp_max)
-        
-        # Create filtered temperature frame
-        filtered_temp_frame = temp_frame.copy()
-        filtered_temp_frame[~mask] = np.nan  # Set out-of-range values to NaN
-        
-        return filtered_temp_frame, mask
+        return (temp_frame >= self.filter_temp_min) & (temp_frame <= self.filter_temp_max)
     
     def get_min_max_temperatures(self) -> Optional[Dict]:
         """
@@ -134,47 +264,19 @@ class ThermalCameraCapture:
             return None
             
         try:
-            # Get raw frame and temperature data
-            ret, frame = self.camera.read()
-            if not ret:
+            # Latest temperature data from the capture thread
+            temp_frame = self._get_latest_temp_frame()
+            if temp_frame is None:
                 return None
             
-            info, temp_lut = self.camera.info()
-            temp_frame = temp_lut[frame]
-            
-            # Apply temperature filter
-            filtered_temp_frame, mask = self.apply_temperature_filter(temp_frame)
-            
-            # Check if any pixels are within range
-            if not np.any(mask):
-                logger.warning(f"No temperatures found in range {self.filter_temp_min}C to {self.filter_temp_max}C")
-                return None
-            
-            # Find min and max temperatures only within the filtered range
-            valid_temps = filtered_temp_frame[mask]
-            min_temp = np.min(valid_temps)
-            max_temp = np.max(valid_temps)
-            
-            # Find coordinates of min and max temperatures within the filtered data
-            min_idx = np.unravel_index(np.nanargmin(filtered_temp_frame), filtered_temp_frame.shape)
-            max_idx = np.unravel_index(np.nanargmax(filtered_temp_frame), filtered_temp_frame.shape)
-            
-            # Convert to (x, y) coordinates (note: numpy is (row, col) = (y, x))
-            min_coords = (int(min_idx[1]), int(min_idx[0]))  # (x, y)
-            max_coords = (int(max_idx[1]), int(max_idx[0]))  # (x, y)
-            
-            min_max_data = {
-                'min_temp': round(float(min_temp), 1),
-                'max_temp': round(float(max_temp), 1),
-                'min_coords': min_coords,
-                'max_coords': max_coords,
-                'temp_range': round(float(max_temp - min_temp), 1),
-                'filtered': self.enable_temp_filter,
-                'filter_range': f"{self.filter_temp_min}C-{self.filter_temp_max}C" if self.enable_temp_filter else "All"
-            }
+            with self._settings_lock:
+                use_filter = self.enable_temp_filter
+                filter_min = self.filter_temp_min
+                filter_max = self.filter_temp_max
             
-            # Cache for GUI display
-            self.last_min_max_data = min_max_data
+            min_max_data = self._compute_min_max_data(temp_frame, use_filter, filter_min, filter_max)
+            if min_max_data is None:
+                logger.warning(f"No temperatures found in range {filter_min}C to {filter_max}C")
             
             return min_max_data
             
@@ -182,13 +284,63 @@ class ThermalCameraCapture:
             logger.error(f"Error getting min/max temperatures: {e}")
             return None
     
+    def _compute_min_max_data(self, temp_frame: np.ndarray, use_filter: bool,
+                              filter_min: float, filter_max: float) -> Optional[Dict]:
+        """
+        Find min/max temperatures and their coordinates within the filter range.
+        
+        Args:
+            temp_frame: Temperature data array
+            use_filter, filter_min, filter_max: Filter settings snapshot for this frame
+            
+        Returns:
+            Min/max dict (also cached for the GUI), or None if no pixel is in range
+        """
+        if NUMBA_AVAILABLE:
+            # Single fused pass - no mask or NaN copy
+            min_temp, min_y, min_x, max_temp, max_y, max_x, found = min_max_scan(
+                temp_frame, filter_min, filter_max, use_filter
+            )
+            if not found:
+                return None
+        else:
+            if use_filter:
+                mask = (temp_frame >= filter_min) & (temp_frame <= filter_max)
+                if not np.any(mask):
+                    return None
+                low = np.where(mask, temp_frame, np.inf)
+                high = np.where(mask, temp_frame, -np.inf)
+            else:
+                low = high = temp_frame
+            
+            # numpy indices are (row, col) = (y, x)
+            min_y, min_x = np.unravel_index(np.argmin(low), temp_frame.shape)
+            max_y, max_x = np.unravel_index(np.argmax(high), temp_frame.shape)
+            min_temp = temp_frame[min_y, min_x]
+            max_temp = temp_frame[max_y, max_x]
+        
+        min_max_data = {
+            'min_temp': round(float(min_temp), 1),
+            'max_temp': round(float(max_temp), 1),
+            'min_coords': (int(min_x), int(min_y)),  # (x, y)
+            'max_coords': (int(max_x), int(max_y)),  # (x, y)
+            'temp_range': round(float(max_temp - min_temp), 1),
+            'filtered': use_filter,
+            'filter_range': f"{filter_min}C-{filter_max}C" if use_filter else "All"
+        }
+        
+        # Cache for GUI display
+        self.last_min_max_data = min_max_data
+        
+        return min_max_data
+    
     def draw_min_max_overlay(self, display_frame: np.ndarray, min_max_data: Dict) -> np.ndarray:
-        """Draw min/max temperature overlays on the display frame."""
+        """Draw min/max temperature overlays on the display frame (in place)."""
         if min_max_data is None:
             return display_frame
         
-        overlay_frame = display_frame.copy()
-        
+        # Markers cover a handful of pixels - draw straight into the frame
+        # rather than copying the whole image first
         # Extract temperature data and coordinates
         min_temp = min_max_data['min_temp']
         max_temp = min_max_data['max_temp']
@@ -202,125 +354,128 @@ class ThermalCameraCapture:
         thickness = 1
         
         # Draw cold spot (blue)
-        cv2.circle(overlay_frame, min_coords, marker_size, (0, 100, 255), thickness)
-        cv2.circle(overlay_frame, min_coords, marker_size + 2, (255, 255, 255), 1)
+        cv2.circle(display_frame, min_coords, marker_size, (0, 100, 255), thickness)
+        cv2.circle(display_frame, min_coords, marker_size + 2, (255, 255, 255), 1)
         
         min_label = f"COLD: {min_temp:.1f}C"
         label_pos = (min_coords[0] + 10, min_coords[1] - 8)
         
         # Keep labels within frame bounds
-        if label_pos[0] + 100 > overlay_frame.shape[1]:
+        if label_pos[0] + 100 > display_frame.shape[1]:
             label_pos = (min_coords[0] - 100, min_coords[1] - 8)
         if label_pos[1] < 15:
             label_pos = (label_pos[0], min_coords[1] + 20)
             
-        cv2.putText(overlay_frame, min_label, label_pos, font, font_scale, (0, 100, 255), thickness)
-        cv2.putText(overlay_frame, min_label, label_pos, font, font_scale, (255, 255, 255), 1)
+        cv2.putText(display_frame, min_label, label_pos, font, font_scale, (0, 100, 255), thickness)
+        cv2.putText(display_frame, min_label, label_pos, font, font_scale, (255, 255, 255), 1)
         
         # Draw hot spot (red)
-        cv2.circle(overlay_frame, max_coords, marker_size, (0, 0, 255), thickness)
-        cv2.circle(overlay_frame, max_coords, marker_size + 2, (255, 255, 255), 1)
+        cv2.circle(display_frame, max_coords, marker_size, (0, 0, 255), thickness)
+        cv2.circle(display_frame, max_coords, marker_size + 2, (255, 255, 255), 1)
         
         max_label = f"HOT: {max_temp:.1f}C"
         label_pos = (max_coords[0] + 10, max_coords[1] - 8)
         
         # Keep labels within frame bounds
-        if label_pos[0] + 100 > overlay_frame.shape[1]:
+        if label_pos[0] + 100 > display_frame.shape[1]:
             label_pos = (max_coords[0] - 100, max_coords[1] - 8)
         if label_pos[1] < 15:
             label_pos = (label_pos[0], max_coords[1] + 20)
             
-        cv2.putText(overlay_frame, max_label, label_pos, font, font_scale, (0, 0, 255), thickness)
-        cv2.putText(overlay_frame, max_label, label_pos, font, font_scale, (255, 255, 255), 1)
+        cv2.putText(display_frame, max_label, label_pos, font, font_scale, (0, 0, 255), thickness)
+        cv2.putText(display_frame, max_label, label_pos, font, font_scale, (255, 255, 255), 1)
         
-        return overlay_frame
+        return display_frame
     
     def get_latest_frame(self) -> Optional[np.ndarray]:
-        """Get latest thermal frame - using our proven processing pipeline with optional min/max overlay and temperature filtering."""
+        """Get latest thermal frame - using our proven processing pipeline with optional min/max overlay and temperature filtering.
+
+        The returned array is one of two reused output buffers: it stays valid
+        until the next two calls. Copy it if it is kept longer or handed to
+        another thread.
+        """
         if not self.running or not self.camera:
             return None
             
         try:
-            # Capture frame using proven method
-            ret, frame = self.camera.read()
-            if not ret:
+            # Latest temperature data from the capture thread
+            temp_frame = self._get_latest_temp_frame()
+            if temp_frame is None:
                 return None
             
-            # Get temperature info using proven method
-            info, temp_lut = self.camera.info()
-            temp_frame = temp_lut[frame]
-            
-            # Apply temperature range filter
-            filtered_temp_frame, temp_mask = self.apply_temperature_filter(temp_frame)
+            # Snapshot settings once so the whole frame uses consistent values
+            # even if the GUI thread changes them mid-frame
+            with self._settings_lock:
+                use_filter = self.enable_temp_filter
+                filter_min = self.filter_temp_min
+                filter_max = self.filter_temp_max
+                palette_lut = self._palette_lut
+                show_min_max = self.show_min_max
+                auto_exposure = self.auto_exposure
             
             # Get min/max data if enabled (from filtered data)
             min_max_data = None
-            if self.show_min_max:
-                # Calculate min/max from the filtered temp_frame
-                if np.any(temp_mask):  # Only if there are valid temperatures in range
-                    valid_temps = filtered_temp_frame[temp_mask]
-                    min_temp = np.min(valid_temps)
-                    max_temp = np.max(valid_temps)
-                    min_idx = np.unravel_index(np.nanargmin(filtered_temp_frame), filtered_temp_frame.shape)
-                    max_idx = np.unravel_index(np.nanargmax(filtered_temp_frame), filtered_temp_frame.shape)
-                    
-                    min_coords = (int(min_idx[1]), int(min_idx[0]))  # (x, y)
-                    max_coords = (int(max_idx[1]), int(max_idx[0]))  # (x, y)
-                    
-                    min_max_data = {
-                        'min_temp': round(float(min_temp), 1),
-                        'max_temp': round(float(max_temp), 1),
-                        'min_coords': min_coords,
-                        'max_coords': max_coords,
-                        'temp_range': round(float(max_temp - min_temp), 1),
-                        'filtered': self.enable_temp_filter,
-                        'filter_range': f"{self.filter_temp_min}C-{self.filter_temp_max}C" if self.enable_temp_filter else "All"
-                    }
-                    
-                    # Cache for GUI display
-                    self.last_min_max_data = min_max_data
-            
-            # Process for display using filtered data
-            display_temp_frame = filtered_temp_frame.copy()
-            
-            if self.auto_exposure and np.any(temp_mask):
+            if show_min_max:
+                min_max_data = self._compute_min_max_data(temp_frame, use_filter, filter_min, filter_max)
+            
+            # Apply temperature range filter - the min/max pass already tells us
+            # whether any pixel is in range, so only build a mask without it
+            temp_mask = None
+            any_valid = True
+            if use_filter:
+                if show_min_max:
+                    any_valid = min_max_data is not None
+                else:
+                    temp_mask = (temp_frame >= filter_min) & (temp_frame <= filter_max)
+                    any_valid = np.any(temp_mask)
+            
+            temp_min, temp_max = self.temp_min, self.temp_max
+            if auto_exposure and any_valid:
                 # Auto-adjust temperature range from valid (filtered) temperatures only
-                valid_temps = display_temp_frame[temp_mask]
-                temp_min, temp_max = np.percentile(valid_temps, [1, 99])
-                self.temp_min = temp_min
-                self.temp_max = temp_max
-            elif self.enable_temp_filter:
+                if use_filter:
+                    value_range = (filter_min, filter_max)
+                else:
+                    value_range = (float(temp_frame.min()), float(temp_frame.max()))
+                temp_min, temp_max = self._histogram_percentiles(temp_frame, value_range)
+            elif use_filter:
                 # Use filter range for display normalization
-                self.temp_min = self.filter_temp_min
-                self.temp_max = self.filter_temp_max
-            
-            # Normalize temperature data for display
-            # Handle NaN values (out-of-range temperatures)
-            temp_norm = np.zeros_like(display_temp_frame)
-            valid_mask = ~np.isnan(display_temp_frame)
-            
-            if np.any(valid_mask):
-                temp_norm[valid_mask] = np.clip(
-                    (display_temp_frame[valid_mask] - self.temp_min) / (self.temp_max - self.temp_min + 1e-6), 
-                    0, 1
-                )
-            
-            # Convert to 8-bit and apply colormap
-            temp_norm_8bit = (temp_norm * 255).astype(np.uint8)
-            
-            # Apply colormap
-            display_frame = cv2.applyColorMap(temp_norm_8bit, self.colormap)
-            
-            # Set out-of-range pixels to dark gray/black
-            if self.enable_temp_filter:
-                out_of_range_color = [20, 20, 20]  # Dark gray
-                display_frame[~temp_mask] = out_of_range_color
-            
-            # Convert BGR to RGB for Qt display
-            display_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
+                temp_min, temp_max = filter_min, filter_max
+            self.temp_min = temp_min
+            self.temp_max = temp_max
+            
+            # Render into the next of two persistent buffers - the caller may
+            # still hold the previous frame (e.g. wrapped in a QImage)
+            out_shape = temp_frame.shape + (3,)
+            if not self._out_buffers or self._out_buffers[0].shape != out_shape:
+                self._out_buffers = [np.empty(out_shape, dtype=np.uint8) for _ in range(2)]
+            display_frame = self._out_buffers[self._out_idx]
+            self._out_idx ^= 1
+            
+            if NUMBA_AVAILABLE:
+                # Fused normalize + colormap + out-of-range mask in a single pass
+                render_thermal(temp_frame, palette_lut, temp_min, temp_max,
+                               filter_min, filter_max, use_filter, display_frame)
+            else:
+                # Normalize temperature data for display (out-of-range pixels are
+                # painted over below, so no NaN copy of the frame is needed)
+                temp_norm = (temp_frame - temp_min) / (temp_max - temp_min + 1e-6)
+                np.clip(temp_norm, 0, 1, out=temp_norm)
+                
+                # Convert to 8-bit and apply colormap
+                temp_norm_8bit = (temp_norm * 255).astype(np.uint8)
+                
+                # Apply colormap via the precomputed palette LUT (already RGB for Qt)
+                np.take(palette_lut, temp_norm_8bit, axis=0, out=display_frame, mode='clip')
+                
+                # Set out-of-range pixels to dark gray/black
+                if use_filter:
+                    if temp_mask is None:
+                        temp_mask = (temp_frame >= filter_min) & (temp_frame <= filter_max)
+                    out_of_range_color = [20, 20, 20]  # Dark gray
+                    display_frame[~temp_mask] = out_of_range_color
             
             # Add min/max overlay if enabled
-            if self.show_min_max and min_max_data is not None:
+            if show_min_max and min_max_data is not None:
                 display_frame = self.draw_min_max_overlay(display_frame, min_max_data)
             
             return display_frame
@@ -329,6 +484,26 @@ class ThermalCameraCapture:
             logger.error(f"Error getting HT301 frame: {e}")
             return None
     
+    def get_display_frame(self, target_size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Get the latest rendered frame resized to fit target_size (width, height).
+        
+        Rendering and resizing run in the capture thread, so a changed
+        target_size takes effect from the next sensor frame. Frames are
+        C-contiguous uint8 (H, W, 3) pool buffers, ready to wrap in a QImage
+        without a copy.
+        """
+        self.display_size = target_size
+        return self._latest_display_frame
+    
+    def set_frame_callback(self, callback: Optional[Callable[[], None]]):
+        """Set a callable invoked from the capture thread after each new frame (None to clear)."""
+        self.frame_callback = callback
+    
+    def get_frame_counter(self) -> int:
+        """Get the number of sensor frames published so far (changes only when a new frame arrives)."""
+        return self.frame_counter
+    
     def is_running(self) -> bool:
         """Check if camera is running."""
         return self.running and self.camera is not None
@@ -339,13 +514,10 @@ class ThermalCameraCapture:
             return None
             
         try:
-            ret, frame = self.camera.read()
-            if not ret:
+            temp_frame = self._get_latest_temp_frame()
+            if temp_frame is None:
                 return None
             
-            info, temp_lut = self.camera.info()
-            temp_frame = temp_lut[frame]
-            
             if 0 <= y < temp_frame.shape[0] and 0 <= x < temp_frame.shape[1]:
                 try:
                     temp_value = float(temp_frame[y, x])
@@ -361,7 +533,8 @@ class ThermalCameraCapture:
         if self.camera and self.running:
             try:
                 logger.info("Calibrating HT301 camera...")
-                self.camera.calibrate()
+                with self._camera_lock:
+                    self.camera.calibrate()
                 logger.info("HT301 calibration complete")
                 return True
             except Exception as e:
@@ -377,15 +550,17 @@ class ThermalCameraCapture:
             (cv2.COLORMAP_VIRIDIS, "VIRIDIS")
         ]
         
-        # Find current index and cycle to next
-        current_idx = 0
-        for i, (cmap, name) in enumerate(colormaps):
-            if cmap == self.colormap:
-                current_idx = i
-                break
-        
-        next_idx = (current_idx + 1) % len(colormaps)
-        self.colormap, palette_name = colormaps[next_idx]
+        with self._settings_lock:
+            # Find current index and cycle to next
+            current_idx = 0
+            for i, (cmap, name) in enumerate(colormaps):
+                if cmap == self.colormap:
+                    current_idx = i
+                    break
+            
+            next_idx = (current_idx + 1) % len(colormaps)
+            self.colormap, palette_name = colormaps[next_idx]
+            self._palette_lut = self._build_palette_lut(self.colormap)
         
         logger.info(f"Switched to {palette_name} colormap")
         return palette_name
@@ -396,7 +571,8 @@ class ThermalCameraCapture:
 
     def toggle_min_max_overlay(self) -> bool:
         """Toggle min/max overlay display on/off."""
-        self.show_min_max = not self.show_min_max
+        with self._settings_lock:
+            self.show_min_max = not self.show_min_max
         status = "enabled" if self.show_min_max else "disabled"
         logger.info(f"Min/Max overlay {status}")
         return self.show_min_max
@@ -407,7 +583,8 @@ class ThermalCameraCapture:
 
     def toggle_temperature_filter(self) -> bool:
         """Toggle temperature range filter on/off."""
-        self.enable_temp_filter = not self.enable_temp_filter
+        with self._settings_lock:
+            self.enable_temp_filter = not self.enable_temp_filter
         status = "enabled" if self.enable_temp_filter else "disabled"
         if self.enable_temp_filter:
             logger.info(f"Temperature filter {status}: {self.filter_temp_min}C to {self.filter_temp_max}C")
@@ -415,13 +592,21 @@ class ThermalCameraCapture:
             logger.info(f"Temperature filter {status} - showing all temperatures")
         return self.enable_temp_filter
     
-    def set_temperature_filter_range(self, min_temp: float, max_temp: float) -> bool:
+    def set_temperature_filter_enabled(self, enabled: bool):
+        """Enable or disable the temperature range filter."""
+        with self._settings_lock:
+            self.enable_temp_filter = bool(enabled)
+        logger.info(f"Temperature filter {'enabled' if enabled else 'disabled'}")
+    
+    def set_temperature_filter_range(self, min_temp: float, max_temp: float,
+                                     enabled: Optional[bool] = None) -> bool:
         """
         Update the temperature filter range.
         
         Args:
             min_temp: Minimum temperature for filter
             max_temp: Maximum temperature for filter
+            enabled: Optional - also enable/disable the filter in the same update
             
         Returns:
             True if range was updated successfully
@@ -430,8 +615,12 @@ class ThermalCameraCapture:
             logger.error(f"Invalid temperature range: {min_temp}C >= {max_temp}C")
             return False
         
-        self.filter_temp_min = float(min_temp)
-        self.filter_temp_max = float(max_temp)
+        # One locked update, so a frame never sees a mix of old and new values
+        with self._settings_lock:
+            self.filter_temp_min = float(min_temp)
+            self.filter_temp_max = float(max_temp)
+            if enabled is not None:
+                self.enable_temp_filter = bool(enabled)
         
         logger.info(f"Temperature filter range updated: {self.filter_temp_min}C to {self.filter_temp_max}C")
         return True
@@ -455,7 +644,6 @@ if __name__ == "__main__":
         print("Camera started successfully")
         print("Press Ctrl+C to stop...")
         try:
-            import time
             while True:
                 frame = camera.get_latest_frame()
                 min_max_data = camera.get_last_min_max_data()
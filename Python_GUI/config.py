@@ -0,0 +1,50 @@
+"""
+Configuration Loader for GUI v8
+
+Temperature filter settings live in config.json next to this module so the
+GUI can re-read them at runtime (Ctrl+R) without re-importing main.py.
+"""
+
+import os
+import json
+import logging
+from typing import Dict
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+# Used for any setting missing from config.json
+DEFAULT_CONFIG = {
+    'enable_temp_filter': True,
+    'filter_temp_min': 10.0,
+    'filter_temp_max': 50.0
+}
+
+
+def load_config(path: str = CONFIG_PATH) -> Dict:
+    """
+    Load temperature filter settings from a JSON file.
+    
+    Args:
+        path: Config file path (defaults to config.json beside this module)
+        
+    Returns:
+        Dict with enable_temp_filter, filter_temp_min and filter_temp_max
+    """
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(path, encoding='utf-8') as f:
+            config.update(json.load(f))
+        config['enable_temp_filter'] = bool(config['enable_temp_filter'])
+        config['filter_temp_min'] = float(config['filter_temp_min'])
+        config['filter_temp_max'] = float(config['filter_temp_max'])
+    except FileNotFoundError:
+        logger.warning(f"Config file not found ({path}) - using defaults")
+    except (ValueError, TypeError) as e:
+        # Malformed JSON (JSONDecodeError is a ValueError) or non-numeric values
+        logger.error(f"Invalid config file ({path}): {e} - using defaults")
+        config = dict(DEFAULT_CONFIG)
+    
+    return config
@@ -9,19 +9,23 @@ Features:
 - Side-by-side camera layout for real-time comparison
 - Temperature range filtering with min/max detection
 - Enhanced thermal visualization with overlay markers
-- Configurable temperature filtering from main.py
+- Configurable temperature filtering from config.json
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QGroupBox, QGridLayout, QInputDialog)
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
 from PyQt5.QtGui import QImage, QPixmap, QFont, QPalette, QColor, QKeySequence
 
 # Import sensor capture modules
 from capture_rgb import RGBCameraCapture
 from capture_thermal import ThermalCameraCapture
+from config import load_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -30,6 +34,33 @@ logger = logging.getLogger(__name__)
 class SensorFusionGUI(QMainWindow):
     """Main GUI window for dual-camera display - RGB and thermal cameras side-by-side."""
     
+    # CSS styles for UI elements (class constants - no lookup on the frame path)
+    STYLE_CAMERA = "border: 1px solid gray; background-color: #2a2a2a; font-size: 18px; font-weight: bold;"
+    STYLE_STATUS = "font-size: 26px; font-weight: bold;"
+    STYLE_TEMP = "font-size: 28px; font-weight: bold; color: #4CAF50;"
+    STYLE_RANGE = "font-size: 26px; font-weight: bold; color: #2196F3;"
+    STYLE_FILTER_ENABLED = "font-size: 28px; font-weight: bold; color: #4CAF50;"
+    STYLE_FILTER_DISABLED = "font-size: 28px; font-weight: bold; color: #FF9800;"
+    STYLE_RANGE_HIGH = "color: #FF5722; font-weight: bold;"  # High range - red
+    STYLE_RANGE_MEDIUM = "color: #FF9800; font-weight: bold;"  # Medium range - orange
+    STYLE_RANGE_LOW = "color: #4CAF50; font-weight: bold;"  # Low range - green
+    STYLES = {
+        'camera': STYLE_CAMERA,
+        'status': STYLE_STATUS,
+        'temp': STYLE_TEMP,
+        'range': STYLE_RANGE,
+        'filter_enabled': STYLE_FILTER_ENABLED,
+        'filter_disabled': STYLE_FILTER_DISABLED
+    }
+    
+    # RGB camera indices to probe, in order of preference (external USB first)
+    RGB_CAMERA_INDICES = [0, 1, 3, 4]
+    
+    # Emitted from the capture threads; queued onto the GUI thread
+    rgb_frame_ready = pyqtSignal()
+    thermal_frame_ready = pyqtSignal()
+    rgb_camera_started = pyqtSignal(object)  # RGBCameraCapture or None, from the probe thread
+    
     def __init__(self, temp_filter_enabled=True, temp_filter_min=0.0, temp_filter_max=50.0):
         super().__init__()
         self.setWindowTitle("GUI v8 - Dual Camera with Temperature Range Filter")
@@ -41,17 +72,50 @@ class SensorFusionGUI(QMainWindow):
         self.temp_filter_max = temp_filter_max
         self.rgb_camera = None
         self.thermal_camera = None
+        self._thermal_has_filter = False  # Checked once in start_sensors, not per frame
+        self._closing = False
+        
+        # Frame counters of the last displayed frames (skip redraws when unchanged)
+        self._last_rgb_frame_id = None
+        self._last_thermal_frame_id = None
+        
+        # Persistent QImages over the capture threads' pooled display buffers,
+        # keyed by buffer; each entry also keeps its numpy buffer alive
+        self._qimage_cache = {}
+        
+        # Last text/style pushed to each status label (skip no-op Qt updates)
+        self._label_cache = {}
+        self._last_min_max_key = None  # (min, max, range) currently shown on the thermal labels
+        
+        # Filter label strings - built here and in the filter setters, not per frame
+        self._filter_status_text_enabled = "🎯 Filter: ENABLED (Ctrl+F to toggle)"
+        self._filter_status_text_disabled = "🔄 Filter: DISABLED (Ctrl+F to toggle)"
+        self._filter_range_text_disabled = "Range: All Temps (Ctrl+R to reload config)"
+        self._filter_range_text = ""
+        self._update_filter_range_text()
         
         # Setup UI and cameras
         self.setup_ui_style()
         self.init_ui()
+        
+        # Per-camera stall watchdogs: single-shot timers re-armed on every frame
+        # at a multiple of that camera's measured frame interval
+        self._frame_times = {}  # timer -> (last frame time, smoothed frame interval)
+        self.rgb_stall_timer = self._create_stall_timer(
+            lambda: self.rgb_status.setText("Status: No Frame"))
+        self.thermal_stall_timer = self._create_stall_timer(
+            lambda: self._set_text(self.thermal_status, "Status: No Frame"))
+        
+        self.rgb_frame_ready.connect(self.update_rgb_display, Qt.QueuedConnection)
+        self.thermal_frame_ready.connect(self.update_thermal_display, Qt.QueuedConnection)
+        self.rgb_camera_started.connect(self._on_rgb_camera_started, Qt.QueuedConnection)
         self.start_sensors()
         self.setup_keyboard_shortcuts()
         
-        # Start update loop
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(33)  # 30 Hz
+        # Panels repaint when their camera delivers a frame (no polling timer);
+        # run once now so missing cameras show their status immediately
+        self.update_rgb_display()
+        self.update_thermal_display()
         
         logger.info("GUI initialized - Ctrl+T: Temp range, Ctrl+F: Toggle filter, Ctrl+P: Color palette")
     
@@ -163,31 +227,69 @@ class SensorFusionGUI(QMainWindow):
         font.setBold(True)
         return font
     
+    @staticmethod
+    def _is_qimage_compatible(frame):
+        """
+        Check a frame has the packed 3-byte pixel layout QImage RGB888/BGR888 expects.
+        
+        The capture threads already deliver C-contiguous frames, so this never
+        copies on the GUI thread - a frame that fails is a capture-side bug.
+        """
+        return (frame.ndim == 3 and frame.dtype == np.uint8 and frame.strides[1] == 3
+                and frame.flags['C_CONTIGUOUS'])
+    
+    def _get_qimage(self, frame, image_format):
+        """
+        Get a QImage over a display frame buffer, built once per buffer.
+        
+        The capture threads cycle through a small pool of persistent display
+        buffers, so the same few QImages are reused frame after frame. The
+        cache is dropped when it outgrows the pools (e.g. after a resize
+        reallocated them); pixmaps already shown are copies and unaffected.
+        """
+        key = (frame.ctypes.data, frame.shape, image_format)
+        entry = self._qimage_cache.get(key)
+        if entry is None:
+            if len(self._qimage_cache) >= 8:
+                self._qimage_cache.clear()
+            height, width = frame.shape[:2]
+            qt_image = QImage(frame.data, width, height, frame.strides[0], image_format)
+            entry = self._qimage_cache[key] = (qt_image, frame)  # frame keeps the memory alive
+        return entry[0]
+    
+    def _to_pixmap(self, qt_image):
+        """
+        Convert a QImage to a QPixmap.
+        
+        All frame-to-pixmap conversions go through here. Use the C++
+        QPixmap.fromImage() API - never the emulated QPixmap(qt_image)
+        constructor, which is several times slower per frame.
+        """
+        return QPixmap.fromImage(qt_image)
+    
+    def _set_text(self, label, text):
+        """Set label text only if it changed (setText re-lays out the widget)."""
+        key = (id(label), 'text')
+        if self._label_cache.get(key) != text:
+            label.setText(text)
+            self._label_cache[key] = text
+    
+    def _set_style(self, label, style):
+        """Set label stylesheet only if it changed (setStyleSheet re-polishes the widget)."""
+        key = (id(label), 'style')
+        if self._label_cache.get(key) != style:
+            label.setStyleSheet(style)
+            self._label_cache[key] = style
+    
     def get_style(self, element_type):
         """Get CSS style for different UI elements."""
-        styles = {
-            'camera': "border: 1px solid gray; background-color: #2a2a2a; font-size: 18px; font-weight: bold;",
-            'status': "font-size: 26px; font-weight: bold;",
-            'temp': "font-size: 28px; font-weight: bold; color: #4CAF50;",
-            'range': "font-size: 26px; font-weight: bold; color: #2196F3;",
-            'filter_enabled': "font-size: 28px; font-weight: bold; color: #4CAF50;",
-            'filter_disabled': "font-size: 28px; font-weight: bold; color: #FF9800;"
-        }
-        return styles.get(element_type, "")
+        return self.STYLES.get(element_type, "")
     
     def start_sensors(self):
         """Start both cameras."""
-        # Try RGB cameras (external USB first)
-        for camera_idx in [0, 1, 3, 4]:
-            try:
-                self.rgb_camera = RGBCameraCapture(camera_index=camera_idx, target_fps=30)
-                if self.rgb_camera.start():
-                    logger.info(f"RGB camera started on index {camera_idx}")
-                    break
-                self.rgb_camera = None
-            except Exception as e:
-                logger.debug(f"RGB camera index {camera_idx} failed: {e}")
-                self.rgb_camera = None
+        # Probe RGB cameras in the background - opening a device can block for
+        # hundreds of ms per index, which would delay the first window paint
+        threading.Thread(target=self._probe_rgb_cameras, daemon=True).start()
         
         # Start thermal camera
         try:
@@ -200,108 +302,233 @@ class SensorFusionGUI(QMainWindow):
             if not self.thermal_camera.start():
                 logger.warning("Thermal camera failed to start")
                 self.thermal_camera = None
+            else:
+                self._thermal_has_filter = hasattr(self.thermal_camera, 'enable_temp_filter')
+                self.thermal_camera.set_frame_callback(self.thermal_frame_ready.emit)
         except Exception as e:
             logger.error(f"Thermal camera error: {e}")
             self.thermal_camera = None
     
-    def update_displays(self):
-        """Update both camera displays - RGB and thermal with enhanced min/max info."""
-        self.update_rgb_display()  # Now active for dual camera mode
-        self.update_thermal_display()
+    def _try_open_rgb(self, camera_idx):
+        """Try to start an RGB camera on one index; returns the camera or None."""
+        try:
+            camera = RGBCameraCapture(camera_index=camera_idx, target_fps=30)
+            if camera.start():
+                return camera
+        except Exception as e:
+            logger.debug(f"RGB camera index {camera_idx} failed: {e}")
+        return None
+    
+    def _rgb_index_opens(self, camera_idx):
+        """Cheap check that an RGB camera index opens (no capture thread is started)."""
+        try:
+            return RGBCameraCapture(camera_index=camera_idx, target_fps=30).probe()
+        except Exception as e:
+            logger.debug(f"RGB camera index {camera_idx} probe failed: {e}")
+            return False
+    
+    def _probe_rgb_cameras(self):
+        """Check candidate RGB indices in parallel, then start only the most preferred one that opens."""
+        with ThreadPoolExecutor(max_workers=len(self.RGB_CAMERA_INDICES)) as executor:
+            opens = list(executor.map(self._rgb_index_opens, self.RGB_CAMERA_INDICES))
+        
+        chosen = None
+        for camera_idx, ok in zip(self.RGB_CAMERA_INDICES, opens):
+            if ok:
+                chosen = self._try_open_rgb(camera_idx)
+                if chosen is not None:
+                    break
+        self.rgb_camera_started.emit(chosen)
+    
+    def _on_rgb_camera_started(self, camera):
+        """Adopt the RGB camera found by the probe thread (runs on the GUI thread)."""
+        if camera is None:
+            logger.warning("No RGB camera found")
+            return
+        if self._closing:
+            camera.stop()
+            return
+        
+        logger.info(f"RGB camera started on index {camera.camera_index}")
+        self.rgb_camera = camera
+        self.rgb_camera.set_frame_callback(self.rgb_frame_ready.emit)
+        self.update_rgb_display()
+    
+    def _create_stall_timer(self, on_stall):
+        """Create a single-shot watchdog that calls on_stall when a camera stops delivering frames."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(on_stall)
+        return timer
+    
+    def _rearm_stall_timer(self, timer):
+        """Restart a camera's stall watchdog from its measured frame cadence."""
+        now = time.monotonic()
+        last_time, interval = self._frame_times.get(timer, (None, None))
+        if last_time is not None:
+            frame_dt = now - last_time
+            interval = frame_dt if interval is None else 0.9 * interval + 0.1 * frame_dt
+        self._frame_times[timer] = (now, interval)
+        
+        # Five missed frames (at least 0.5 s) counts as stalled
+        timeout = 0.5 if interval is None else max(0.5, 5 * interval)
+        timer.start(int(timeout * 1000))
     
     def update_rgb_display(self):
         """Update RGB camera display - active in dual camera mode."""
-        if not self.rgb_camera or not self.rgb_camera.is_running():
-            self.rgb_status.setText("Status: Disconnected")
+        # Bind widgets/camera once - this runs for every RGB frame
+        camera = self.rgb_camera
+        label = self.rgb_label
+        status = self.rgb_status
+        
+        if not camera or not camera.is_running():
+            status.setText("Status: Disconnected")
             return
         
-        # Get latest frame
-        frame = self.rgb_camera.get_latest_frame()
+        # Queued signals can pile up behind a slow paint - skip if already shown
+        frame_id = camera.get_frame_counter()
+        if frame_id == self._last_rgb_frame_id:
+            return
+        self._last_rgb_frame_id = frame_id
+        
+        # Get latest frame (rendered and resized to the panel by the capture thread)
+        label_width, label_height = label.width(), label.height()
+        frame = camera.get_display_frame((label_width, label_height))
         if frame is not None:
-            # Convert to QPixmap and display
-            height, width, channels = frame.shape
-            bytes_per_line = channels * width
-            qt_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image)
+            # Wrap the frame without copying
+            if not self._is_qimage_compatible(frame):
+                logger.warning(f"Dropping RGB frame with unexpected layout: shape={frame.shape}, strides={frame.strides}")
+                return
+            height, width = frame.shape[:2]
+            qt_image = self._get_qimage(frame, QImage.Format_BGR888)  # OpenCV BGR, Qt >= 5.14
+            pixmap = self._to_pixmap(qt_image)
             
-            # Scale to fit display
-            scaled_pixmap = pixmap.scaled(self.rgb_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.rgb_label.setPixmap(scaled_pixmap)
-            self.rgb_status.setText("Status: Connected")
+            # Frames arrive pre-sized; only a frame captured before a resize needs scaling
+            if width > label_width or height > label_height:
+                pixmap = pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+            label.setPixmap(pixmap)
+            status.setText("Status: Connected")
+            self._rearm_stall_timer(self.rgb_stall_timer)
         else:
-            self.rgb_status.setText("Status: No Frame")
+            status.setText("Status: No Frame")
     
     def update_thermal_display(self):
         """Update thermal camera display with enhanced min/max information and filter status."""
-        if not self.thermal_camera or not self.thermal_camera.is_running():
-            self.thermal_status.setText("Status: Disconnected")
-            self.thermal_min_max.setText("Min/Max: -- / -- C")
-            self.thermal_range.setText("Range: -- C")
-            self.thermal_filter_status.setText("Filter: Disconnected")
-            self.thermal_filter_range.setText("Range: -- C")
+        # Queued signals can pile up behind a slow paint - skip if already shown
+        connected = self.thermal_camera is not None and self.thermal_camera.is_running()
+        if connected and self.thermal_camera.get_frame_counter() == self._last_thermal_frame_id:
+            return
+        
+        # Batch the pixmap and label changes into one repaint of the panel
+        panel = self.thermal_label.parentWidget()
+        panel.setUpdatesEnabled(False)
+        try:
+            self._update_thermal_panel()
+        finally:
+            panel.setUpdatesEnabled(True)
+    
+    def _update_thermal_panel(self):
+        """Push the latest thermal frame and status text into the panel widgets."""
+        # Bind widgets/camera/helpers once - this runs for every thermal frame
+        camera = self.thermal_camera
+        label = self.thermal_label
+        status = self.thermal_status
+        min_max_label = self.thermal_min_max
+        range_label = self.thermal_range
+        filter_status = self.thermal_filter_status
+        filter_range = self.thermal_filter_range
+        set_text = self._set_text
+        set_style = self._set_style
+        
+        if not camera or not camera.is_running():
+            set_text(status, "Status: Disconnected")
+            set_text(min_max_label, "Min/Max: -- / -- C")
+            set_text(range_label, "Range: -- C")
+            set_text(filter_status, "Filter: Disconnected")
+            set_text(filter_range, "Range: -- C")
+            self._last_min_max_key = None
             return
         
         # Update filter status display
         if self.temp_filter_enabled:
-            self.thermal_filter_status.setText("🎯 Filter: ENABLED (Ctrl+F to toggle)")
-            self.thermal_filter_range.setText(f"Range: {self.temp_filter_min}°C-{self.temp_filter_max}°C (Ctrl+T to change)")
-            style = self.get_style('filter_enabled')
+            set_text(filter_status, self._filter_status_text_enabled)
+            set_text(filter_range, self._filter_range_text)
+            style = self.STYLE_FILTER_ENABLED
         else:
-            self.thermal_filter_status.setText("🔄 Filter: DISABLED (Ctrl+F to toggle)")
-            self.thermal_filter_range.setText("Range: All Temps (Ctrl+R to reload config)")
-            style = self.get_style('filter_disabled')
+            set_text(filter_status, self._filter_status_text_disabled)
+            set_text(filter_range, self._filter_range_text_disabled)
+            style = self.STYLE_FILTER_DISABLED
             
-        self.thermal_filter_status.setStyleSheet(style)
-        self.thermal_filter_range.setStyleSheet(style)
+        set_style(filter_status, style)
+        set_style(filter_range, style)
         
-        # Get latest frame (with min/max overlay if enabled)
-        frame = self.thermal_camera.get_latest_frame()
+        self._last_thermal_frame_id = camera.get_frame_counter()
+        
+        # Get latest frame - rendered with the min/max overlay and resized to the panel by the capture thread
+        label_width, label_height = label.width(), label.height()
+        frame = camera.get_display_frame((label_width, label_height))
         if frame is not None:
-            # Convert to QPixmap and display
-            height, width, channels = frame.shape
-            bytes_per_line = channels * width
-            qt_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image)
+            # Wrap the frame without copying
+            if not self._is_qimage_compatible(frame):
+                logger.warning(f"Dropping thermal frame with unexpected layout: shape={frame.shape}, strides={frame.strides}")
+                return
+            height, width = frame.shape[:2]
+            qt_image = self._get_qimage(frame, QImage.Format_RGB888)
+            pixmap = self._to_pixmap(qt_image)
             
-            # Scale to fit display
-            scaled_pixmap = pixmap.scaled(self.thermal_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.thermal_label.setPixmap(scaled_pixmap)
+            # Frames arrive pre-sized; only a frame captured before a resize needs scaling
+            if width > label_width or height > label_height:
+                pixmap = pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+            label.setPixmap(pixmap)
+            self._rearm_stall_timer(self.thermal_stall_timer)
             
             # Update status based on filtering
-            if hasattr(self.thermal_camera, 'enable_temp_filter') and self.thermal_camera.enable_temp_filter:
-                self.thermal_status.setText("Status: Connected - Filtered Min/Max")
+            filtered = self._thermal_has_filter and camera.enable_temp_filter
+            if filtered:
+                set_text(status, "Status: Connected - Filtered Min/Max")
             else:
-                self.thermal_status.setText("Status: Connected - Full Range Min/Max")
+                set_text(status, "Status: Connected - Full Range Min/Max")
             
             # Update min/max information display
-            min_max_data = self.thermal_camera.get_last_min_max_data()
+            min_max_data = camera.get_last_min_max_data()
             if min_max_data is not None:
                 min_temp = min_max_data['min_temp']
                 max_temp = min_max_data['max_temp']
                 temp_range = min_max_data['temp_range']
                 
-                # Update status labels with color coding
-                self.thermal_min_max.setText(f"🔵 {min_temp:.1f}C / 🔴 {max_temp:.1f}C")
-                self.thermal_range.setText(f"Range: {temp_range:.1f}C")
-                
-                # Color code the range based on temperature spread
-                if temp_range > 20:
-                    self.thermal_range.setStyleSheet("color: #FF5722; font-weight: bold;")  # High range - red
-                elif temp_range > 10:
-                    self.thermal_range.setStyleSheet("color: #FF9800; font-weight: bold;")  # Medium range - orange
-                else:
-                    self.thermal_range.setStyleSheet("color: #4CAF50; font-weight: bold;")  # Low range - green
+                # Values are already rounded to 0.1C - skip formatting when nothing changed
+                min_max_key = (min_temp, max_temp, temp_range)
+                if min_max_key != self._last_min_max_key:
+                    self._last_min_max_key = min_max_key
+                    
+                    # Update status labels with color coding
+                    set_text(min_max_label, f"🔵 {min_temp:.1f}C / 🔴 {max_temp:.1f}C")
+                    set_text(range_label, f"Range: {temp_range:.1f}C")
+                    
+                    # Color code the range based on temperature spread
+                    if temp_range > 20:
+                        set_style(range_label, self.STYLE_RANGE_HIGH)
+                    elif temp_range > 10:
+                        set_style(range_label, self.STYLE_RANGE_MEDIUM)
+                    else:
+                        set_style(range_label, self.STYLE_RANGE_LOW)
             else:
-                if hasattr(self.thermal_camera, 'enable_temp_filter') and self.thermal_camera.enable_temp_filter:
-                    self.thermal_min_max.setText("Min/Max: No temps in range")
-                    self.thermal_range.setText("Range: No data")
+                self._last_min_max_key = None
+                if filtered:
+                    set_text(min_max_label, "Min/Max: No temps in range")
+                    set_text(range_label, "Range: No data")
                 else:
-                    self.thermal_min_max.setText("Min/Max: Processing...")
-                    self.thermal_range.setText("Range: Processing...")
+                    set_text(min_max_label, "Min/Max: Processing...")
+                    set_text(range_label, "Range: Processing...")
         else:
-            self.thermal_status.setText("Status: No Frame")
-            self.thermal_min_max.setText("Min/Max: -- / -- C")
-            self.thermal_range.setText("Range: -- C")
+            set_text(status, "Status: No Frame")
+            set_text(min_max_label, "Min/Max: -- / -- C")
+            set_text(range_label, "Range: -- C")
+            self._last_min_max_key = None
+    
+    def _update_filter_range_text(self):
+        """Rebuild the filter range label text after the range changes."""
+        self._filter_range_text = f"Range: {self.temp_filter_min}°C-{self.temp_filter_max}°C (Ctrl+T to change)"
     
     def update_temperature_filter_range(self, min_temp, max_temp, enabled=None):
         """
@@ -319,12 +546,11 @@ class SensorFusionGUI(QMainWindow):
         self.temp_filter_max = max_temp
         if enabled is not None:
             self.temp_filter_enabled = enabled
+        self._update_filter_range_text()
         
         # Update thermal camera settings if it exists
         if self.thermal_camera and hasattr(self.thermal_camera, 'set_temperature_filter_range'):
-            self.thermal_camera.set_temperature_filter_range(min_temp, max_temp)
-            if enabled is not None:
-                self.thermal_camera.enable_temp_filter = enabled
+            self.thermal_camera.set_temperature_filter_range(min_temp, max_temp, enabled)
                 
         logger.info(f"Temperature filter updated successfully")
     
@@ -336,9 +562,9 @@ class SensorFusionGUI(QMainWindow):
         self.temp_range_shortcut = QShortcut(QKeySequence("Ctrl+T"), self)
         self.temp_range_shortcut.activated.connect(self.prompt_temperature_range_update)
         
-        # Ctrl+R: Reload config from main.py  
+        # Ctrl+R: Reload config from config.json
         self.reload_config_shortcut = QShortcut(QKeySequence("Ctrl+R"), self)
-        self.reload_config_shortcut.activated.connect(self.reload_config_from_main)
+        self.reload_config_shortcut.activated.connect(self.reload_config)
         
         # Ctrl+F: Toggle temperature filter
         self.toggle_filter_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
@@ -398,29 +624,25 @@ class SensorFusionGUI(QMainWindow):
         except Exception as e:
             logger.error(f"Error updating temperature range: {e}")
     
-    def reload_config_from_main(self):
-        """Reload configuration values from main.py without restarting."""
+    def reload_config(self):
+        """Reload configuration values from config.json without restarting."""
         try:
-            # Re-import main module to get fresh values
-            import importlib
-            import main
-            importlib.reload(main)
-            
-            # Get fresh config
-            config = main.get_current_config()
+            # Read the settings file directly - re-importing main.py would re-run
+            # its Qt/OpenCV imports and logging setup
+            config = load_config()
             
             # Update our settings
             self.temp_filter_enabled = config['enable_temp_filter']
             self.temp_filter_min = config['filter_temp_min'] 
             self.temp_filter_max = config['filter_temp_max']
+            self._update_filter_range_text()
             
             # Update thermal camera if available
             if self.thermal_camera:
-                self.thermal_camera.enable_temp_filter = self.temp_filter_enabled
-                self.thermal_camera.filter_temp_min = self.temp_filter_min
-                self.thermal_camera.filter_temp_max = self.temp_filter_max
+                self.thermal_camera.set_temperature_filter_range(
+                    self.temp_filter_min, self.temp_filter_max, self.temp_filter_enabled)
                 
-            logger.info(f"Config reloaded from main.py:")
+            logger.info(f"Config reloaded from config.json:")
             logger.info(f"   Filter enabled: {self.temp_filter_enabled}")
             logger.info(f"   Range: {self.temp_filter_min}°C to {self.temp_filter_max}°C")
             
@@ -434,7 +656,7 @@ class SensorFusionGUI(QMainWindow):
             
             # Update thermal camera if available
             if self.thermal_camera:
-                self.thermal_camera.enable_temp_filter = self.temp_filter_enabled
+                self.thermal_camera.set_temperature_filter_enabled(self.temp_filter_enabled)
                 
             status = "ENABLED" if self.temp_filter_enabled else "DISABLED"
             logger.info(f"Temperature filter {status}")
@@ -457,15 +679,17 @@ class SensorFusionGUI(QMainWindow):
     def closeEvent(self, event):
         """Handle GUI close event."""
         logger.info("Shutting down GUI v8 Dual Camera...")
+        self._closing = True  # An RGB probe still in flight stops its camera
+        self.rgb_stall_timer.stop()
+        self.thermal_stall_timer.stop()
         
-        # Stop both cameras
+        # Stop both cameras (detach callbacks first so no signals outlive the window)
         if self.rgb_camera:
+            self.rgb_camera.set_frame_callback(None)
             self.rgb_camera.stop()
         if self.thermal_camera:
+            self.thermal_camera.set_frame_callback(None)
             self.thermal_camera.stop()
         
-        # Stop timer
-        self.update_timer.stop()
-        
         logger.info("GUI v8 Dual Camera shutdown complete")
         event.accept() 
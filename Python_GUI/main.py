@@ -7,19 +7,15 @@ Dual-camera GUI for simultaneous RGB and thermal camera display:
 - HT301 thermal camera (USB) - With configurable temperature range filtering
 - Side-by-side display layout for real-time comparison
 
-Temperature filtering controlled from configuration section below.
+Temperature filtering controlled from config.json (Ctrl+R reloads it at runtime).
 """
 
-# Temperature Filter Configuration
-ENABLE_TEMP_FILTER = True
-FILTER_TEMP_MIN = 10.0
-FILTER_TEMP_MAX = 50.0
-
 import sys
 import logging
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
+from config import load_config
 from gui_window import SensorFusionGUI
 
 # Configure logging
@@ -29,6 +25,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Temperature Filter Configuration (edit config.json)
+CONFIG = load_config()
+ENABLE_TEMP_FILTER = CONFIG['enable_temp_filter']
+FILTER_TEMP_MIN = CONFIG['filter_temp_min']
+FILTER_TEMP_MAX = CONFIG['filter_temp_max']
+
 
 def check_dependencies():
     """Check if all required dependencies are available."""
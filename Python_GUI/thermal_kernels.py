@@ -0,0 +1,112 @@
+"""
+Thermal Frame Processing Kernels
+
+Numba-compiled per-pixel kernels for the HT301 display pipeline.
+Each kernel makes a single pass over the frame instead of chaining
+full-frame NumPy temporaries. Numba is optional - check NUMBA_AVAILABLE
+and fall back to the NumPy path in capture_thermal.py when it is missing.
+"""
+
+import logging
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+    logger.info("Numba available - using fused thermal kernels")
+except ImportError as e:
+    NUMBA_AVAILABLE = False
+    logger.warning(f"Numba not available, using NumPy thermal pipeline: {e}")
+
+    # Plain-Python stand-ins so this module still imports without Numba
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+@njit(parallel=True, cache=True)
+def render_thermal(temp_frame, palette_lut, temp_min, temp_max,
+                   filter_min, filter_max, use_filter, out_rgb):
+    """
+    Normalize, colormap and mask a temperature frame in one pass.
+
+    Args:
+        temp_frame: (H, W) temperatures in C
+        palette_lut: (256, 3) uint8 RGB palette
+        temp_min, temp_max: Display normalization range
+        filter_min, filter_max: Valid temperature range when use_filter is set
+        use_filter: Paint out-of-range pixels dark gray
+        out_rgb: (H, W, 3) uint8 output, written in RGB order
+    """
+    height, width = temp_frame.shape
+    scale = 255.0 / (temp_max - temp_min + 1e-6)
+    for y in prange(height):
+        for x in range(width):
+            t = temp_frame[y, x]
+            if use_filter and (t < filter_min or t > filter_max):
+                out_rgb[y, x, 0] = 20
+                out_rgb[y, x, 1] = 20
+                out_rgb[y, x, 2] = 20
+                continue
+            v = (t - temp_min) * scale
+            if v < 0.0:
+                v = 0.0
+            elif v > 255.0:
+                v = 255.0
+            idx = int(v)
+            out_rgb[y, x, 0] = palette_lut[idx, 0]
+            out_rgb[y, x, 1] = palette_lut[idx, 1]
+            out_rgb[y, x, 2] = palette_lut[idx, 2]
+
+
+@njit(cache=True)
+def min_max_scan(temp_frame, filter_min, filter_max, use_filter):
+    """
+    Find min/max temperatures and their pixel positions in one pass.
+
+    Returns:
+        (min_temp, min_y, min_x, max_temp, max_y, max_x, found) where found
+        is False if no pixel lies inside the filter range
+    """
+    height, width = temp_frame.shape
+    min_temp = np.inf
+    max_temp = -np.inf
+    min_y = min_x = max_y = max_x = 0
+    found = False
+    for y in range(height):
+        for x in range(width):
+            t = temp_frame[y, x]
+            if use_filter and (t < filter_min or t > filter_max):
+                continue
+            found = True
+            if t < min_temp:
+                min_temp = t
+                min_y = y
+                min_x = x
+            if t > max_temp:
+                max_temp = t
+                max_y = y
+                max_x = x
+    return min_temp, min_y, min_x, max_temp, max_y, max_x, found
+
+
+def warmup_kernels(dtype):
+    """
+    Compile the kernels for a temperature dtype before the first real frame.
+
+    Call from the capture thread so the one-off JIT cost (or on-disk cache
+    load) never lands on the GUI thread's first get_latest_frame().
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    temp_frame = np.zeros((2, 2), dtype=dtype)
+    palette_lut = np.zeros((256, 3), dtype=np.uint8)
+    out_rgb = np.empty((2, 2, 3), dtype=np.uint8)
+    render_thermal(temp_frame, palette_lut, 0.0, 1.0, 0.0, 1.0, True, out_rgb)
+    min_max_scan(temp_frame, 0.0, 1.0, True)
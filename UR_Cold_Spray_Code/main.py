@@ -9,8 +9,6 @@ except ImportError:
     print("❌  The 'keyboard' package is required. Install it via:  pip install keyboard")
     sys.exit(1)
 
-import urx
-
 # Project modules -------------------------------------------------------------
 import robot_functions as rf
 
@@ -38,8 +36,7 @@ def go_home():
 def go_home_l():
     """Move linearly (movel) to the HOME Cartesian pose using low speed."""
     print("Moving linearly to HOME pose …")
-    rf.send_movel(robot, HOME_POSE, acc=ACC, vel=VEL)
-    rf.wait_until_pose(robot, HOME_POSE)
+    rf.movel_and_wait(robot, HOME_POSE, acc=ACC, vel=VEL)
     print("✓ Reached HOME pose (movel)")
 
 
@@ -49,8 +46,7 @@ TCP_OFFSET_MM = (-277.81, 0.0, 60.3, 0.0, 0.0, 0.0)
 # -----------------------------------------------------------------------------
 
 print("Connecting to robot …")
-robot = urx.Robot(ROBOT_IP)
-print(f"✓ Connected to UR robot at {ROBOT_IP}\n")
+robot = rf.connect_robot(ROBOT_IP)
 rf.set_tcp_offset(robot, *TCP_OFFSET_MM)
 # -----------------------------------------------------------------------------
 # Helper functions
@@ -101,7 +97,7 @@ def _cleanup_exit():
     """Safely close the robot connection and exit the program."""
     print("\nExiting – closing robot connection …")
     try:
-        robot.close()
+        rf.disconnect_robot(robot)
     finally:
         sys.exit(0)
 
@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import math
 import time
-import urx
 
 import robot_functions as rf
 import spray_test_V1 as st
@@ -37,7 +36,7 @@ TCP_OFFSET_MM = (-272.81, 0.0, 60.3, 0.0, 0.0, 0.0)
 # -----------------------------------------------------------------------------
 
 def main():
-    robot = urx.Robot(ROBOT_IP)
+    robot = rf.connect_robot(ROBOT_IP)
     try:
         # Configure TCP
         rf.set_tcp_offset(robot, *TCP_OFFSET_MM)
@@ -61,8 +60,7 @@ def main():
         rf.move_to_joint_position(robot, st.home, acc=ACC, vel=VEL, wait=True)
 
     finally:
-        robot.close()
-        print("✓ Robot connection closed")
+        rf.disconnect_robot(robot)
 
 
 if __name__ == "__main__":
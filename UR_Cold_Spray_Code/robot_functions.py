@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import io
 import math
 import time
 from typing import List, Sequence
 
+import numpy as np
 import urx
 from urx.urrobot import RobotException
 
+# Optional ur_rtde receive interface: streams robot state so waits read the
+# latest sample instead of polling urx
+try:
+    import rtde_receive
+    RTDE_AVAILABLE = True
+except ImportError:
+    RTDE_AVAILABLE = False
+
 # Constants and Configuration
 JOINT_EPS_DEG = 0.05           # joint-angle tolerance in °
 POS_EPS_MM = 1               # linear tolerance in mm
@@ -17,8 +27,18 @@ JOINT_EPS = math.radians(JOINT_EPS_DEG)
 POS_EPS = POS_EPS_MM / 1000.0
 ORI_EPS = math.radians(ORI_EPS_DEG)
 POLL = 0.005                    
+RTDE_POLL = 0.001              # poll period when reading streamed RTDE state
+VERIFY_POLL = 0.02             # urx poll period once a move's predicted duration has elapsed
 TIMEOUT = 180                 
 
+# URScript templates (%-formatting)
+_POSE_FMT = "%.6f, %.6f, %.6f, %.6f, %.6f, %.6f"
+# servoj inside the controller-side waypoint loop: cycle time expression, lookahead, gain
+_SERVOJ_FMT = "    servoj(get_inverse_kin(poses[i]), t=%s, lookahead_time=%s, gain=%s)"
+# Pose moves: pose values, acc, vel, then "" or the ", r=..." blend suffix
+_MOVEL_FMT = "movel(p[" + _POSE_FMT + "], a=%s, v=%s%s)"
+_MOVEJ_POSE_FMT = "movej(p[" + _POSE_FMT + "], a=%s, v=%s%s)"
+
 # -----------------------------------------------------------------------------
 # Robot Connection and Basic Operations
 # -----------------------------------------------------------------------------
@@ -27,12 +47,31 @@ def connect_robot(ip: str) -> urx.Robot:
     """Connect to UR robot at specified IP address."""
     robot = urx.Robot(ip)
     print(f"✓ Connected to UR10 at {ip}")
+    attach_rtde(robot, ip)
     return robot
 
+def attach_rtde(robot: urx.Robot, ip: str):
+    """Attach a ur_rtde receive interface so pose/joint reads use streamed state."""
+    robot.rtde_r = None
+    if not RTDE_AVAILABLE:
+        return
+    try:
+        robot.rtde_r = rtde_receive.RTDEReceiveInterface(ip)
+        print("✓ RTDE receive interface connected")
+    except Exception as e:
+        print(f"⚠️ RTDE unavailable, polling via urx: {e}")
+
+def _rtde(robot: urx.Robot):
+    """RTDE receive interface attached by connect_robot, or None."""
+    return getattr(robot, "rtde_r", None)
+
 def disconnect_robot(robot: urx.Robot):
     """Safely disconnect from robot."""
     try:
         stop_linear(robot)
+        if _rtde(robot) is not None:
+            robot.rtde_r.disconnect()
+            robot.rtde_r = None
         robot.close()
         print("✓ Robot connection closed")
     except Exception as e:
@@ -42,50 +81,62 @@ def disconnect_robot(robot: urx.Robot):
 # Motion Control and Waiting Functions
 # -----------------------------------------------------------------------------
 
-def wait_until_joints(robot: urx.Robot, target: Sequence[float]) -> None:
-    """Wait until robot reaches target joint configuration."""
+def wait_until_joints(robot: urx.Robot, target: Sequence[float], poll: float | None = None) -> None:
+    """Wait until robot reaches target joint configuration (poll=None picks the period)."""
     start = time.time()
+    rtde_r = _rtde(robot)
+    read_joints = rtde_r.getActualQ if rtde_r is not None else robot.getj
+    if poll is None:
+        poll = RTDE_POLL if rtde_r is not None else POLL
+    target_np = np.asarray(target, dtype=np.float64)
     while True:
-        cur = robot.getj()
-        if max(abs(c - t) for c, t in zip(cur, target)) < JOINT_EPS:
+        cur_np = np.asarray(read_joints(), dtype=np.float64)
+        if np.abs(cur_np - target_np).max() < JOINT_EPS:
             return
         if time.time() - start > TIMEOUT:
             print("⚠️  joint wait timeout; continuing")
             return
-        time.sleep(POLL)
+        time.sleep(poll)
 
-def get_tcp_pose(robot: urx.Robot) -> List[float]:
-    """Get current TCP pose [x, y, z, rx, ry, rz]."""
-    pose = robot.getl()
-    if pose is None or len(pose) != 6:
+def get_tcp_pose(robot: urx.Robot) -> np.ndarray:
+    """Get current TCP pose [x, y, z, rx, ry, rz] as a float64 array of shape (6,)."""
+    rtde_r = _rtde(robot)
+    pose = rtde_r.getActualTCPPose() if rtde_r is not None else robot.getl()
+    if pose is None:
+        raise RuntimeError("Invalid TCP pose from robot")
+    pose_arr = np.asarray(pose, dtype=np.float64)
+    if pose_arr.shape != (6,):
         raise RuntimeError("Invalid TCP pose from robot")
-    return list(map(float, pose))
+    return pose_arr
 
-def get_joint_angles(robot: urx.Robot) -> List[float]:
-    """Get current joint angles [j1, j2, j3, j4, j5, j6]."""
-    angles = robot.getj()
-    if angles is None or len(angles) != 6:
+def get_joint_angles(robot: urx.Robot) -> np.ndarray:
+    """Get current joint angles [j1, j2, j3, j4, j5, j6] as a float64 array of shape (6,)."""
+    rtde_r = _rtde(robot)
+    angles = rtde_r.getActualQ() if rtde_r is not None else robot.getj()
+    if angles is None:
         raise RuntimeError("Invalid joint angles from robot")
-    return list(map(float, angles))
+    angles_arr = np.asarray(angles, dtype=np.float64)
+    if angles_arr.shape != (6,):
+        raise RuntimeError("Invalid joint angles from robot")
+    return angles_arr
 
 
 def wait_until_pose(robot: urx.Robot, target: Sequence[float]) -> None:
     """Wait until robot reaches target TCP pose."""
     start = time.time()
-    def ang_err(a: float, b: float) -> float:
-        diff = abs(a - b) % (2 * math.pi)
-        return diff if diff <= math.pi else (2 * math.pi - diff)
-
+    poll = RTDE_POLL if _rtde(robot) is not None else POLL
+    target_np = np.asarray(target, dtype=np.float64)
     while True:
-        cur = get_tcp_pose(robot)
-        pos_err = max(abs(c - t) for c, t in zip(cur[:3], target[:3]))
-        ori_err = max(ang_err(c, t) for c, t in zip(cur[3:], target[3:]))
+        cur_np = get_tcp_pose(robot)
+        pos_err = np.abs(cur_np[:3] - target_np[:3]).max()
+        # Orientation difference wrapped to [-π, π) without branching
+        ori_err = np.abs(np.mod(cur_np[3:] - target_np[3:] + math.pi, 2 * math.pi) - math.pi).max()
         if pos_err < POS_EPS and ori_err < ORI_EPS:
             return
         if time.time() - start > TIMEOUT:
             print("⚠️  pose wait timeout; continuing")
             return
-        time.sleep(POLL)
+        time.sleep(poll)
 
 def send_movel(
     robot: urx.Robot,
@@ -95,9 +146,20 @@ def send_movel(
     blend_mm: float = 0.0,
 ):
     """Send movel command with optional blend radius (mm)."""
-    pose_str = ", ".join(f"{v:.6f}" for v in pose)
-    r_part = f", r={blend_mm/1000.0:.4f}" if blend_mm > 0 else ""
-    robot.send_program(f"movel(p[{pose_str}], a={acc}, v={vel}{r_part})")
+    robot.send_program(_movel_cmd(pose, acc, vel, blend_mm))
+
+def movel_and_wait(robot: urx.Robot, pose: Sequence[float], acc: float = 1.2, vel: float = 0.5):
+    """Run a movel and block until the TCP reaches pose."""
+    send_movel(robot, pose, acc, vel)
+    wait_until_pose(robot, pose)
+
+def _movel_cmd(pose: Sequence[float], acc: float, vel: float, blend_mm: float = 0.0) -> str:
+    """URScript movel statement for a pose with optional blend radius (mm)."""
+    return _MOVEL_FMT % (*pose, acc, vel, _blend_part(blend_mm))
+
+def _blend_part(blend_mm: float) -> str:
+    """Blend-radius argument suffix for a move command ("" when not blending)."""
+    return ", r=%.4f" % (blend_mm / 1000.0) if blend_mm > 0 else ""
 
 
 # New helper: joint-interpolated move to pose (lets robot choose minimal joint path)
@@ -110,9 +172,7 @@ def send_movej_pose(
     blend_mm: float = 0.0,
 ):
     """Send movej command targeting a Cartesian pose (UR will IK to joints) with optional blend radius."""
-    pose_str = ", ".join(f"{v:.6f}" for v in pose)
-    r_part = f", r={blend_mm/1000.0:.4f}" if blend_mm > 0 else ""
-    robot.send_program(f"movej(p[{pose_str}], a={acc}, v={vel}{r_part})")
+    robot.send_program(_MOVEJ_POSE_FMT % (*pose, acc, vel, _blend_part(blend_mm)))
 
 def stop_linear(robot: urx.Robot, acc: float = 1.2):
     """Stop linear motion."""
@@ -124,13 +184,25 @@ def stop_linear(robot: urx.Robot, acc: float = 1.2):
 def move_to_joint_position(robot: urx.Robot, joints: Sequence[float], acc: float = 1.2, vel: float = 0.5, wait: bool = True):
     """Move robot to specified joint configuration."""
     print("Moving to target joint position …")
+    start_joints = get_joint_angles(robot) if wait else None
     try:
         robot.movej(joints, acc=acc, vel=vel, wait=False)
     except RobotException as e:
         if "Robot stopped" not in str(e):
             raise
     if wait:
-        wait_until_joints(robot, joints)
+        # Sleep through most of the predicted move time, then verify with a slow poll
+        eta = _trapezoid_duration(np.abs(np.asarray(joints, dtype=np.float64) - start_joints).max(), acc, vel)
+        time.sleep(0.9 * eta)
+        wait_until_joints(robot, joints, poll=VERIFY_POLL if _rtde(robot) is None else None)
+
+def _trapezoid_duration(distance: float, acc: float, vel: float) -> float:
+    """Duration of a trapezoidal (or triangular, if vel is never reached) profile over distance."""
+    if acc <= 0.0 or vel <= 0.0:
+        return 0.0
+    if distance >= vel * vel / acc:
+        return distance / vel + vel / acc
+    return 2.0 * math.sqrt(distance / acc)
 
 def send_urscript(robot: urx.Robot, script: str):
     """Send raw URScript to robot."""
@@ -177,6 +249,17 @@ def _aa_to_mat(rx: float, ry: float, rz: float):
     theta = math.sqrt(rx * rx + ry * ry + rz * rz)
     if theta < 1e-12:
         return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    if theta < 0.01:
+        # Small angle: R = I + a[r]x + b[r]x² with Taylor series for
+        # a = sin θ/θ and b = (1 - cos θ)/θ² (no trig, error < 1e-10)
+        t2 = theta * theta
+        a = 1.0 - t2 / 6.0
+        b = 0.5 - t2 / 24.0
+        return [
+            [1.0 - b * (ry * ry + rz * rz), b * rx * ry - a * rz, b * rx * rz + a * ry],
+            [b * rx * ry + a * rz, 1.0 - b * (rx * rx + rz * rz), b * ry * rz - a * rx],
+            [b * rx * rz - a * ry, b * ry * rz + a * rx, 1.0 - b * (rx * rx + ry * ry)],
+        ]
     kx, ky, kz = rx / theta, ry / theta, rz / theta
     c = math.cos(theta)
     s = math.sin(theta)
@@ -187,45 +270,174 @@ def _aa_to_mat(rx: float, ry: float, rz: float):
         [kz * kx * v - ky * s, kz * ky * v + kx * s, kz * kz * v + c],
     ]
 
-def _mat_mul(a, b):
-    """Matrix multiplication for 3×3 matrices."""
-    return [
-        [sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)]
-        for i in range(3)
+def _mat_to_aa(R):
+    """Convert 3×3 rotation matrix to axis-angle vector.
+
+    Goes through a quaternion, which stays accurate near 0 and π where the
+    acos((trace - 1)/2) route loses precision.
+    """
+    return _quat_to_aa(_mat_to_quat(R))
+
+def _mat_to_quat(R):
+    """Convert 3×3 rotation matrix to quaternion (w, x, y, z) (Shoemake)."""
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = R
+    trace = r00 + r11 + r22
+    if trace > 0.0:
+        s = math.sqrt(trace + 1.0) * 2.0
+        return (0.25 * s, (r21 - r12) / s, (r02 - r20) / s, (r10 - r01) / s)
+    # Otherwise pivot on the largest diagonal entry
+    if r00 >= r11 and r00 >= r22:
+        s = math.sqrt(max(1.0 + r00 - r11 - r22, 0.0)) * 2.0
+        return ((r21 - r12) / s, 0.25 * s, (r01 + r10) / s, (r02 + r20) / s)
+    if r11 >= r22:
+        s = math.sqrt(max(1.0 + r11 - r00 - r22, 0.0)) * 2.0
+        return ((r02 - r20) / s, (r01 + r10) / s, 0.25 * s, (r12 + r21) / s)
+    s = math.sqrt(max(1.0 + r22 - r00 - r11, 0.0)) * 2.0
+    return ((r10 - r01) / s, (r02 + r20) / s, (r12 + r21) / s, 0.25 * s)
+
+def _tilted_aa_batch(q0, axes: np.ndarray, angles) -> np.ndarray:
+    """Axis-angle vectors (N, 3) of q_tilt ⊗ q0, where q_tilt turns by angles about unit axes (N, 3).
+
+    angles is an (N,) array, or a scalar for a constant tilt (half-angle trig done once).
+    """
+    half = 0.5 * np.asarray(angles, dtype=float)
+    tw = np.cos(half)
+    tv = np.sin(half)[..., None] * axes
+    w0 = q0[0]
+    v0 = np.asarray(q0[1:], dtype=float)
+
+    # Hamilton product with the constant start quaternion on the right
+    w = tw * w0 - tv @ v0
+    v = tw[..., None] * v0 + w0 * tv + np.cross(tv, v0)
+
+    # q and -q are the same rotation; pick the one with θ <= π
+    sign = np.where(w < 0.0, -1.0, 1.0)
+    w = w * sign
+    v = v * sign[:, None]
+    vec_norm = np.sqrt(np.einsum("ij,ij->i", v, v))
+    theta = 2.0 * np.arctan2(vec_norm, w)
+    scale = np.divide(theta, vec_norm, out=np.zeros_like(theta), where=vec_norm > 1e-12)
+    return v * scale[:, None]
+
+def _format_rows(rows: np.ndarray, row_fmt: str, sep: str = "\n") -> str:
+    """Format every row of an array with one %-template, joined by sep."""
+    buf = io.StringIO()
+    np.savetxt(buf, rows, fmt=row_fmt, newline=sep)
+    return buf.getvalue()[:-len(sep)]
+
+def _servoj_loop(poses: np.ndarray, cycle_times, lookahead_time: float, gain: int) -> List[str]:
+    """URScript lines that servoj through poses (N, 6) with a loop on the controller.
+
+    The poses go out once as a list literal and a single servoj line is
+    looped over them, instead of one servoj/sync pair per waypoint.
+    cycle_times is a per-waypoint array, or a string for a constant time.
+    """
+    if not len(poses):
+        return []
+    lines = ["  poses = [" + _format_rows(poses, "p[" + _POSE_FMT + "]", sep=", ") + "]"]
+    if isinstance(cycle_times, str):
+        t_expr = cycle_times
+    else:
+        lines.append("  times = [" + _format_rows(cycle_times, "%.6f", sep=", ") + "]")
+        t_expr = "times[i]"
+    lines += [
+        "  i = 0",
+        f"  while i < {len(poses)}:",
+        _SERVOJ_FMT % (t_expr, lookahead_time, gain),
+        "    sync()",
+        "    i = i + 1",
+        "  end",
     ]
+    return lines
+
+def _mat_to_aa_batch(R: np.ndarray) -> np.ndarray:
+    """Convert a stack of rotation matrices (N, 3, 3) to axis-angle vectors (N, 3)."""
+    trace = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+    theta = np.arccos(np.clip((trace - 1.0) / 2.0, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    skew = np.stack([
+        R[:, 2, 1] - R[:, 1, 2],
+        R[:, 0, 2] - R[:, 2, 0],
+        R[:, 1, 0] - R[:, 0, 1],
+    ], axis=1)
+
+    # Regular case: axis from the skew-symmetric part; θ/sin θ → 1 near the identity
+    regular = sin_theta > 1e-6
+    scale = np.where(regular, theta / (2.0 * np.where(regular, sin_theta, 1.0)), 0.5)
+    aa = skew * scale[:, None]
+
+    # Near θ = π the skew part vanishes: recover the axis from the largest
+    # diagonal entry instead (Shoemake). Rare, so a loop over those rows is fine.
+    for n in np.flatnonzero(~regular & (theta > 1.0)):
+        m = R[n]
+        i = int(np.argmax(np.diagonal(m)))
+        j, k = (i + 1) % 3, (i + 2) % 3
+        s = math.sqrt(max(1.0 + m[i, i] - m[j, j] - m[k, k], 0.0)) * 2.0
+        q = np.empty(3)
+        q[i] = 0.25 * s
+        q[j] = (m[j, i] + m[i, j]) / s
+        q[k] = (m[k, i] + m[i, k]) / s
+        if m[k, j] - m[j, k] < 0.0:
+            q = -q
+        aa[n] = q / np.linalg.norm(q) * theta[n]
+    return aa
+
+def _aa_to_quat(rx: float, ry: float, rz: float):
+    """Convert axis-angle vector to unit quaternion (w, x, y, z)."""
+    theta = math.sqrt(rx * rx + ry * ry + rz * rz)
+    if theta < 1e-4:
+        # Taylor series of sin(θ/2)/θ - avoids 0/0 near the identity
+        k = 0.5 - theta * theta / 48.0
+    else:
+        k = math.sin(0.5 * theta) / theta
+    return (math.cos(0.5 * theta), rx * k, ry * k, rz * k)
 
-def _mat_to_aa(R):
-    """Convert 3×3 rotation matrix to axis-angle vector."""
-    trace = R[0][0] + R[1][1] + R[2][2]
-    cos_theta = max(min((trace - 1.0) / 2.0, 1.0), -1.0)
-    theta = math.acos(cos_theta)
-    if theta < 1e-12:
+def _axis_quat(axis: int, angle_rad: float):
+    """Quaternion for a rotation about the X (0), Y (1) or Z (2) axis."""
+    half = 0.5 * angle_rad
+    q = [math.cos(half), 0.0, 0.0, 0.0]
+    q[axis + 1] = math.sin(half)
+    return tuple(q)
+
+def _xyz_quat(rx: float, ry: float, rz: float):
+    """Quaternion for rotations about X, then Y, then Z (tool frame), in radians.
+
+    Closed form of _axis_quat(0, rx) ⊗ _axis_quat(1, ry) ⊗ _axis_quat(2, rz).
+    """
+    cx, sx = math.cos(0.5 * rx), math.sin(0.5 * rx)
+    cy, sy = math.cos(0.5 * ry), math.sin(0.5 * ry)
+    cz, sz = math.cos(0.5 * rz), math.sin(0.5 * rz)
+    return (
+        cx * cy * cz - sx * sy * sz,
+        sx * cy * cz + cx * sy * sz,
+        cx * sy * cz - sx * cy * sz,
+        cx * cy * sz + sx * sy * cz,
+    )
+
+def _quat_mul(a, b):
+    """Hamilton product a ⊗ b (rotation b applied in the frame of a)."""
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    return (
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+def _quat_to_aa(q):
+    """Convert quaternion (w, x, y, z) to axis-angle vector with angle in [0, π]."""
+    w, x, y, z = q
+    vec_norm = math.sqrt(x * x + y * y + z * z)
+    if vec_norm < 1e-12:
         return (0.0, 0.0, 0.0)
-    sin_theta = math.sin(theta)
-    rx = (R[2][1] - R[1][2]) / (2.0 * sin_theta) * theta
-    ry = (R[0][2] - R[2][0]) / (2.0 * sin_theta) * theta
-    rz = (R[1][0] - R[0][1]) / (2.0 * sin_theta) * theta
-    return (rx, ry, rz)
-
-def _rot_y(angle_rad: float):
-    """Rotation matrix about Y axis by angle_rad (right-hand rule)."""
-    c = math.cos(angle_rad)
-    s = math.sin(angle_rad)
-    return [[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]
-
-def _rot_z(angle_rad: float):
-    """Rotation matrix about Z axis by angle_rad (right-hand rule)."""
-    c = math.cos(angle_rad)
-    s = math.sin(angle_rad)
-    return [[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]
-
-# Add new rotation helper about X axis
-
-def _rot_x(angle_rad: float):
-    """Rotation matrix about X axis by angle_rad (right-hand rule)."""
-    c = math.cos(angle_rad)
-    s = math.sin(angle_rad)
-    return [[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]]
+    if w < 0.0:
+        # q and -q are the same rotation; pick the one with θ <= π
+        w, x, y, z = -w, -x, -y, -z
+    # atan2 form stays accurate near 0 and π and ignores the quaternion's norm
+    theta = 2.0 * math.atan2(vec_norm, w)
+    scale = theta / vec_norm
+    return (x * scale, y * scale, z * scale)
 
 # -----------------------------------------------------------------------------
 # Advanced TCP Motion Functions
@@ -233,76 +445,32 @@ def _rot_x(angle_rad: float):
 
 def rotate_tcp_y(robot: urx.Robot, degrees: float, acc: float = 1.2, vel: float = 0.5):
     """Rotate the tool around its own Y (green) axis by degrees."""
-    pose = get_tcp_pose(robot)
-    x, y, z, rx, ry, rz = pose
-
-    # Current orientation → matrix
-    R = _aa_to_mat(rx, ry, rz)
-
-    # Incremental rotation about local Y axis
-    dR = _rot_y(math.radians(degrees))
-
-    # Compose: R_new = R * dR (apply in tool frame)
-    R_new = _mat_mul(R, dR)
+    new_pose = rotate_tcp(robot, acc=acc, vel=vel, rotations=[(1, degrees)])
+    if new_pose is None:
+        return  # zero rotation, nothing moved
 
-    # Back to axis-angle
-    rx_n, ry_n, rz_n = _mat_to_aa(R_new)
-
-    # Send motion with unchanged translation and new orientation
-    new_pose = [x, y, z, rx_n, ry_n, rz_n]
-    send_movel(robot, new_pose, acc, vel)
-    wait_until_pose(robot, new_pose)
+    print(
+        f"   ↳ Rotated {degrees:.1f}° about tool Y-axis (green); now Ry component = {math.degrees(new_pose[4]):.2f}°"
+    )
 
 def rotate_tcp_z(robot: urx.Robot, degrees: float, acc: float = 1.2, vel: float = 0.5):
     """Rotate the tool around its own Z (blue) axis by degrees."""
-    pose = get_tcp_pose(robot)
-    x, y, z, rx, ry, rz = pose
-
-    # Current orientation → matrix
-    R = _aa_to_mat(rx, ry, rz)
-
-    # Incremental rotation about local Z axis
-    dR = _rot_z(math.radians(degrees))
-
-    # Compose: R_new = R * dR (apply in tool frame)
-    R_new = _mat_mul(R, dR)
-
-    # Back to axis-angle
-    rx_n, ry_n, rz_n = _mat_to_aa(R_new)
-
-    # Send motion with unchanged translation and new orientation
-    new_pose = [x, y, z, rx_n, ry_n, rz_n]
-    send_movel(robot, new_pose, acc, vel)
-    wait_until_pose(robot, new_pose)
+    new_pose = rotate_tcp(robot, acc=acc, vel=vel, rotations=[(2, degrees)])
+    if new_pose is None:
+        return  # zero rotation, nothing moved
 
     print(
-        f"   ↳ Rotated {degrees:.1f}° about tool Y-axis (green); now Ry component = {math.degrees(ry_n):.2f}°"
+        f"   ↳ Rotated {degrees:.1f}° about tool Z-axis (blue); now Rz component = {math.degrees(new_pose[5]):.2f}°"
     )
 
 def rotate_tcp_x(robot: urx.Robot, degrees: float, acc: float = 1.2, vel: float = 0.5):
     """Rotate the tool around its own X (red) axis by degrees."""
-    pose = get_tcp_pose(robot)
-    x, y, z, rx, ry, rz = pose
-
-    # Current orientation → matrix
-    R = _aa_to_mat(rx, ry, rz)
-
-    # Incremental rotation about local X axis
-    dR = _rot_x(math.radians(degrees))
-
-    # Compose: R_new = R * dR (apply in tool frame)
-    R_new = _mat_mul(R, dR)
-
-    # Back to axis-angle
-    rx_n, ry_n, rz_n = _mat_to_aa(R_new)
-
-    # Send motion with unchanged translation and new orientation
-    new_pose = [x, y, z, rx_n, ry_n, rz_n]
-    send_movel(robot, new_pose, acc, vel)
-    wait_until_pose(robot, new_pose)
+    new_pose = rotate_tcp(robot, acc=acc, vel=vel, rotations=[(0, degrees)])
+    if new_pose is None:
+        return  # zero rotation, nothing moved
 
     print(
-        f"   ↳ Rotated {degrees:.1f}° about tool X-axis (red); now Rx component = {math.degrees(rx_n):.2f}°"
+        f"   ↳ Rotated {degrees:.1f}° about tool X-axis (red); now Rx component = {math.degrees(new_pose[3]):.2f}°"
     )
 
 def translate_tcp(
@@ -317,25 +485,37 @@ def translate_tcp(
     if dx_mm == dy_mm == dz_mm == 0.0:
         return  # nothing to do
 
-    # Current pose and orientation matrix
-    pose = get_tcp_pose(robot)
-    x, y, z, rx, ry, rz = pose
-    R = _aa_to_mat(rx, ry, rz)
+    # Current pose
+    x, y, z, rx, ry, rz = get_tcp_pose(robot).tolist()
 
     # Delta vector in tool frame (→ metres)
-    d_tool = [dx_mm / 1000.0, dy_mm / 1000.0, dz_mm / 1000.0]
+    dx, dy, dz = dx_mm / 1000.0, dy_mm / 1000.0, dz_mm / 1000.0
 
     # Convert to base frame: d_base = R * d_tool
-    d_base = [
-        sum(R[i][j] * d_tool[j] for j in range(3)) for i in range(3)
-    ]
+    if dx == 0.0 and dy == 0.0:
+        # Advance along tool Z only: just the third column of R is needed
+        theta = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if theta < 1e-12:
+            bx, by, bz = 0.0, 0.0, dz
+        else:
+            kx, ky, kz = rx / theta, ry / theta, rz / theta
+            c = math.cos(theta)
+            s = math.sin(theta)
+            v = 1 - c
+            bx = (kx * kz * v + ky * s) * dz
+            by = (ky * kz * v - kx * s) * dz
+            bz = (kz * kz * v + c) * dz
+    else:
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = _aa_to_mat(rx, ry, rz)
+        bx = r00 * dx + r01 * dy + r02 * dz
+        by = r10 * dx + r11 * dy + r12 * dz
+        bz = r20 * dx + r21 * dy + r22 * dz
 
     # New Cartesian position in base frame
-    new_pos = [x + d_base[0], y + d_base[1], z + d_base[2]]
+    new_pos = [x + bx, y + by, z + bz]
 
     new_pose = new_pos + [rx, ry, rz]
-    send_movel(robot, new_pose, acc, vel)
-    wait_until_pose(robot, new_pose)
+    movel_and_wait(robot, new_pose, acc, vel)
 
     # print(
     #     f"   ↳ Translated (tool frame) Δx={dx_mm:.1f} mm, Δy={dy_mm:.1f} mm, Δz={dz_mm:.1f} mm"
@@ -352,30 +532,40 @@ def rotate_tcp(
     rz_deg: float = 0.0,
     acc: float = 1.2,
     vel: float = 0.5,
+    rotations: Sequence[tuple] | None = None,
 ):
     """Incrementally rotate the TCP about its own X, Y and Z axes.
 
     The rotations are applied in **X → Y → Z** order, all in the TOOL frame,
     and the TCP translation is unchanged.
-    """
-    if rx_deg == ry_deg == rz_deg == 0.0:
-        return  # nothing to do
 
-    pose = get_tcp_pose(robot)
-    x, y, z, rx, ry, rz = pose
-    R = _aa_to_mat(rx, ry, rz)
+    rotations, if given, replaces rx/ry/rz_deg with a sequence of
+    (axis, degrees) pairs applied in order, axis being 0/1/2 or "x"/"y"/"z".
+    The whole sequence is folded into one orientation and reached with a
+    single movel. Returns the target pose, or None if there is nothing to do.
+    """
+    if rotations is None:
+        if rx_deg == ry_deg == rz_deg == 0.0:
+            return None  # nothing to do
+        dq = _xyz_quat(math.radians(rx_deg), math.radians(ry_deg), math.radians(rz_deg))
+    else:
+        steps = [_axis_quat("xyz".index(a) if isinstance(a, str) else a, math.radians(deg))
+                 for a, deg in rotations if deg != 0.0]
+        if not steps:
+            return None  # nothing to do
+        dq = steps[0]
+        for step in steps[1:]:
+            dq = _quat_mul(dq, step)
 
-    dR_x = _rot_x(math.radians(rx_deg))
-    dR_y = _rot_y(math.radians(ry_deg))
-    dR_z = _rot_z(math.radians(rz_deg))
+    x, y, z, rx, ry, rz = get_tcp_pose(robot).tolist()
 
-    # Apply increments in sequence (tool-frame)
-    R_new = _mat_mul(_mat_mul(R, dR_x), _mat_mul(dR_y, dR_z))
+    # Apply the increment in the tool frame
+    q_new = _quat_mul(_aa_to_quat(rx, ry, rz), dq)
 
-    rx_n, ry_n, rz_n = _mat_to_aa(R_new)
+    rx_n, ry_n, rz_n = _quat_to_aa(q_new)
     new_pose = [x, y, z, rx_n, ry_n, rz_n]
-    send_movel(robot, new_pose, acc, vel)
-    wait_until_pose(robot, new_pose)
+    movel_and_wait(robot, new_pose, acc, vel)
+    return new_pose
 
     # print(
     #     f"   ↳ Rotated ΔRx={rx_deg:.1f}°, ΔRy={ry_deg:.1f}°, ΔRz={rz_deg:.1f}° (tool frame)"
@@ -411,34 +601,40 @@ def conical_motion_script(
     cos_t, sin_t = math.cos(theta), math.sin(theta)
 
     blend_m = max(0.0, blend_mm) / 1000.0
-    pts = []
-
-    for i in range(steps + 1):
-        phi = 2 * math.pi * revolutions * i / steps
-        ang = math.degrees(phi) % 360
-        if avoid_singular and min(abs(((ang - 90 + 180) % 360) - 180), abs(((ang - 270 + 180) % 360) - 180)) < sing_tol_deg:
-            continue
-
-        cp, sp = math.cos(phi), math.sin(phi)
+    rotations = []
+
+    # Phase of every step; wrist-singular phases are masked out up front
+    phi = 2 * math.pi * revolutions * np.arange(steps + 1) / steps
+    if avoid_singular:
+        ang = np.degrees(phi) % 360
+        keep = np.minimum(np.abs((ang - 90 + 180) % 360 - 180),
+                          np.abs((ang - 270 + 180) % 360 - 180)) >= sing_tol_deg
+        phi = phi[keep]
+
+    # Loop invariants bound to locals (LOAD_FAST instead of global/attribute lookups)
+    sqrt = math.sqrt
+    Zdown = (0.0, 0.0, -1.0)
+    for cp, sp in zip(np.cos(phi).tolist(), np.sin(phi).tolist()):
         X = [cos_t*axis[0] + sin_t*(cp*u[0] + sp*v[0]),
              cos_t*axis[1] + sin_t*(cp*u[1] + sp*v[1]),
              cos_t*axis[2] + sin_t*(cp*u[2] + sp*v[2])]
-        mag = math.sqrt(sum(c*c for c in X)) or 1.0
+        mag = sqrt(X[0]*X[0] + X[1]*X[1] + X[2]*X[2]) or 1.0
         X = [c/mag for c in X]
 
-        Zdown = (0.0, 0.0, -1.0)
         Y = [Zdown[1]*X[2]-Zdown[2]*X[1], Zdown[2]*X[0]-Zdown[0]*X[2], Zdown[0]*X[1]-Zdown[1]*X[0]]
-        mag_y = math.sqrt(sum(c*c for c in Y)) or 1.0
+        mag_y = sqrt(Y[0]*Y[0] + Y[1]*Y[1] + Y[2]*Y[2]) or 1.0
         Y = [c/mag_y for c in Y]
         Z = [X[1]*Y[2]-X[2]*Y[1], X[2]*Y[0]-X[0]*Y[2], X[0]*Y[1]-X[1]*Y[0]]
-        R = [[X[0], Y[0], Z[0]], [X[1], Y[1], Z[1]], [X[2], Y[2], Z[2]]]
-        rx, ry, rz = _mat_to_aa(R)
-        pts.append([x0, y0, z0, rx, ry, rz])
+        rotations.append([[X[0], Y[0], Z[0]], [X[1], Y[1], Z[1]], [X[2], Y[2], Z[2]]])
+
+    # Convert all waypoint orientations to axis-angle in one pass
+    aa = _mat_to_aa_batch(np.asarray(rotations, dtype=float).reshape(-1, 3, 3))
+    pts = np.column_stack([np.tile([x0, y0, z0], (len(aa), 1)), aa]).tolist()
 
     lines = ["def cone_path():"]
     prev = None
     for idx, p in enumerate(pts):
-        pose_str = ", ".join(f"{v:.6f}" for v in p)
+        pose_str = _POSE_FMT % tuple(p)
         if idx == len(pts) - 1 or blend_m == 0.0:
             # Last point or no blending requested
             lines.append(f"  movej(p[{pose_str}], a={acc}, v={vel})")
@@ -446,7 +642,7 @@ def conical_motion_script(
             # Limit blend radius to < half distance to next waypoint (UR requirement)
             if prev is None:
                 prev = p
-            dist = math.sqrt(sum((p[i]-prev[i])**2 for i in range(3)))  # metres
+            dist = sqrt((p[0]-prev[0])**2 + (p[1]-prev[1])**2 + (p[2]-prev[2])**2)  # metres
             max_r = 0.45 * dist  # leave some margin
             r_use = min(blend_m, max_r)
             if r_use < 1e-6:
@@ -486,86 +682,32 @@ def conical_motion_servoj_script(
     x0, y0, z0 = current_pose[0], current_pose[1], current_pose[2]
     starting_rx, starting_ry, starting_rz = current_pose[3], current_pose[4], current_pose[5]
     
-    # Convert starting orientation to rotation matrix
-    starting_angle_mag = math.sqrt(starting_rx*starting_rx + starting_ry*starting_ry + starting_rz*starting_rz)
-    if starting_angle_mag > 1e-6:
-        # Normalized axis
-        start_ax = starting_rx / starting_angle_mag
-        start_ay = starting_ry / starting_angle_mag  
-        start_az = starting_rz / starting_angle_mag
-        
-        # Rodrigues formula for starting rotation matrix
-        cos_theta = math.cos(starting_angle_mag)
-        sin_theta = math.sin(starting_angle_mag)
-        
-        starting_rotation_matrix = [
-            [cos_theta + start_ax*start_ax*(1-cos_theta), start_ax*start_ay*(1-cos_theta) - start_az*sin_theta, start_ax*start_az*(1-cos_theta) + start_ay*sin_theta],
-            [start_ay*start_ax*(1-cos_theta) + start_az*sin_theta, cos_theta + start_ay*start_ay*(1-cos_theta), start_ay*start_az*(1-cos_theta) - start_ax*sin_theta],
-            [start_az*start_ax*(1-cos_theta) - start_ay*sin_theta, start_az*start_ay*(1-cos_theta) + start_ax*sin_theta, cos_theta + start_az*start_az*(1-cos_theta)]
-        ]
-    else:
-        starting_rotation_matrix = [[1,0,0], [0,1,0], [0,0,1]]  # Identity matrix
+    # Starting orientation as a unit quaternion
+    q0 = _aa_to_quat(starting_rx, starting_ry, starting_rz)
 
     theta_tilt = math.radians(tilt_deg)
 
-    # Build full list of poses (axis-angle) that realise the cone
-    pts: list[list[float]] = []
-    for i in range(steps + 1):
-        phi = 2 * math.pi * revolutions * i / steps
-        ang = math.degrees(phi) % 360
-        if avoid_singular and min(
-            abs(((ang - 90 + 180) % 360) - 180),
-            abs(((ang - 270 + 180) % 360) - 180),
-        ) < sing_tol_deg:
-            # Skip configurations that get too close to wrist singularities
-            continue
-
-        # Create rotation axis perpendicular to starting normal direction
-        # This varies around the cone to create the circular motion
-        rotation_axis = [0.0, math.cos(phi), math.sin(phi)]
-        
-        # Normalize rotation axis
-        axis_mag = math.sqrt(rotation_axis[0]*rotation_axis[0] + rotation_axis[1]*rotation_axis[1] + rotation_axis[2]*rotation_axis[2])
-        if axis_mag > 1e-6:
-            rotation_axis = [rotation_axis[0]/axis_mag, rotation_axis[1]/axis_mag, rotation_axis[2]/axis_mag]
-        else:
-            rotation_axis = [0.0, 1.0, 0.0]  # Default to Y-axis
-        
-        # Create rotation matrix for tilt around rotation_axis using Rodrigues formula
-        cos_tilt = math.cos(theta_tilt)
-        sin_tilt = math.sin(theta_tilt)
-        ax, ay, az = rotation_axis[0], rotation_axis[1], rotation_axis[2]
-        
-        R_tilt = [
-            [cos_tilt + ax*ax*(1-cos_tilt), ax*ay*(1-cos_tilt) - az*sin_tilt, ax*az*(1-cos_tilt) + ay*sin_tilt],
-            [ay*ax*(1-cos_tilt) + az*sin_tilt, cos_tilt + ay*ay*(1-cos_tilt), ay*az*(1-cos_tilt) - ax*sin_tilt],
-            [az*ax*(1-cos_tilt) - ay*sin_tilt, az*ay*(1-cos_tilt) + ax*sin_tilt, cos_tilt + az*az*(1-cos_tilt)]
-        ]
-        
-        # Apply rotation to starting orientation: target = R_tilt * starting_rotation_matrix
-        target_rotation_matrix = [
-            [0.0, 0.0, 0.0],
-            [0.0, 0.0, 0.0], 
-            [0.0, 0.0, 0.0]
-        ]
-        
-        for row in range(3):
-            for col in range(3):
-                for k in range(3):
-                    target_rotation_matrix[row][col] += R_tilt[row][k] * starting_rotation_matrix[k][col]
-        
-        # Convert target rotation matrix to axis-angle for UR
-        rx, ry, rz = _mat_to_aa(target_rotation_matrix)
-        pts.append([x0, y0, z0, rx, ry, rz])
-
-    # Assemble URScript program
+    # Phase of every step as one array (trig evaluated once for the whole cone)
+    phi = 2 * math.pi * revolutions * np.arange(steps + 1) / steps
+    if avoid_singular:
+        # Skip configurations that get too close to wrist singularities
+        ang = np.degrees(phi) % 360
+        keep = np.minimum(np.abs((ang - 90 + 180) % 360 - 180),
+                          np.abs((ang - 270 + 180) % 360 - 180)) >= sing_tol_deg
+        phi = phi[keep]
+
+    # Rotation axis perpendicular to starting normal direction, varying around
+    # the cone to create the circular motion. (0, cos φ, sin φ) is unit length.
+    rotation_axes = np.stack([np.zeros_like(phi), np.cos(phi), np.sin(phi)], axis=1)
+
+    # Constant tilt about each axis applied to the starting orientation
+    # (q_tilt ⊗ q0), converted straight to axis-angle for UR
+    aa = _tilted_aa_batch(q0, rotation_axes, theta_tilt)
+    pts = np.column_stack([np.tile([x0, y0, z0], (len(aa), 1)), aa])
+
+    # Assemble URScript program; the controller loops servoj over the pose list
     lines = ["def cone_servoj():"]
-    for p in pts:
-        pose_str = ", ".join(f"{v:.6f}" for v in p)
-        lines.append(
-            f"  servoj(get_inverse_kin(p[{pose_str}]), t={cycle_s}, lookahead_time={lookahead_time}, gain={gain})"
-        )
-        lines.append("  sync()")
+    lines += _servoj_loop(pts, str(cycle_s), lookahead_time, gain)
     lines.append("end")
     lines.append("cone_servoj()")
 
@@ -581,11 +723,21 @@ def wait_until_idle(robot: urx.Robot, eps_rad: float = 0.005, stable_time: float
     *stable_time* seconds.  Useful when secmon/program flags are unreliable.
     """
     start = time.time()
-    last = robot.getj()
+    rtde_r = _rtde(robot)
+    read_joints = rtde_r.getActualQ if rtde_r is not None else robot.getj
+
+    # Preallocated sample buffers: polling allocates no arrays
+    last = np.empty(6)
+    cur = np.empty(6)
+    diff = np.empty(6)
+    last[:] = read_joints()
+    time.sleep(poll)  # first comparison spans a real poll interval
     stable_start = None
     while True:
-        cur = robot.getj()
-        if max(abs(c - l) for c, l in zip(cur, last)) < eps_rad:
+        cur[:] = read_joints()
+        np.subtract(cur, last, out=diff)
+        np.abs(diff, out=diff)
+        if diff.max() < eps_rad:
             # joints have barely moved since last sample
             if stable_start is None:
                 stable_start = time.time()
@@ -596,7 +748,7 @@ def wait_until_idle(robot: urx.Robot, eps_rad: float = 0.005, stable_time: float
         if time.time() - start > timeout:
             print("⚠️  idle wait timeout; continuing")
             return
-        last = cur
+        last, cur = cur, last  # swap buffers instead of copying
         time.sleep(poll)
 
 
@@ -604,8 +756,9 @@ def wait_until_idle(robot: urx.Robot, eps_rad: float = 0.005, stable_time: float
 # Spiral Cold Spray Function
 # -----------------------------------------------------------------------------
 
-def spiral_cold_spray(
-    robot: urx.Robot,
+def _build_spiral_script(
+    start_pose: Sequence[float],
+    start_joints: Sequence[float],
     *,
     tilt_start_deg: float,
     tilt_end_deg: float,
@@ -621,48 +774,20 @@ def spiral_cold_spray(
     cycle_s_start: float = None,
     cycle_s_end: float = None,
     invert_tilt: bool = False,
-):
-    """Generate a radius-scheduled spiral and execute with servoj.
+) -> str:
+    """Build the spiral servoj URScript program for a start pose/joints (pure, no robot I/O).
 
-    - Uses current TCP XYZ as spiral center and current orientation as starting reference.
-    - Keeps the singularity avoidance by skipping phases near 90°/270°.
-    - Creates orientations with linearly varying angle from starting normal direction:
-      tool X-axis angle varies linearly from tilt_start → tilt_end degrees.
-    - If cycle_s_start and cycle_s_end are provided, interpolates cycle time
-      from start to end over the whole spiral. Otherwise uses fixed cycle_s.
-    - If invert_tilt is True, negates both tilt angles to flip the tilt direction.
+    See spiral_cold_spray for the motion.
     """
-    # Get current TCP pose and orientation as starting reference
-    current_pose = get_tcp_pose(robot)
-    x0, y0, z0 = current_pose[0], current_pose[1], current_pose[2]
-    starting_rx, starting_ry, starting_rz = current_pose[3], current_pose[4], current_pose[5]
-    
-    # Store starting joint angles for reliable return movement
-    starting_joints = robot.getj()
-    starting_joints_str = f"[{starting_joints[0]:.6f}, {starting_joints[1]:.6f}, {starting_joints[2]:.6f}, {starting_joints[3]:.6f}, {starting_joints[4]:.6f}, {starting_joints[5]:.6f}]"
+    # Current TCP pose and orientation are the starting reference
+    x0, y0, z0 = start_pose[0], start_pose[1], start_pose[2]
+    starting_rx, starting_ry, starting_rz = start_pose[3], start_pose[4], start_pose[5]
     
-    # Convert starting orientation to rotation matrix to get starting normal direction
-    starting_angle_mag = math.sqrt(starting_rx*starting_rx + starting_ry*starting_ry + starting_rz*starting_rz)
-    if starting_angle_mag > 1e-6:
-        # Normalized axis
-        start_ax = starting_rx / starting_angle_mag
-        start_ay = starting_ry / starting_angle_mag  
-        start_az = starting_rz / starting_angle_mag
-        
-        # Rodrigues formula for starting rotation matrix
-        cos_theta = math.cos(starting_angle_mag)
-        sin_theta = math.sin(starting_angle_mag)
-        
-        starting_rotation_matrix = [
-            [cos_theta + start_ax*start_ax*(1-cos_theta), start_ax*start_ay*(1-cos_theta) - start_az*sin_theta, start_ax*start_az*(1-cos_theta) + start_ay*sin_theta],
-            [start_ay*start_ax*(1-cos_theta) + start_az*sin_theta, cos_theta + start_ay*start_ay*(1-cos_theta), start_ay*start_az*(1-cos_theta) - start_ax*sin_theta],
-            [start_az*start_ax*(1-cos_theta) - start_ay*sin_theta, start_az*start_ay*(1-cos_theta) + start_ax*sin_theta, cos_theta + start_az*start_az*(1-cos_theta)]
-        ]
-    else:
-        starting_rotation_matrix = [[1,0,0], [0,1,0], [0,0,1]]  # Identity matrix
+    # Starting joint angles for reliable return movement
+    starting_joints_str = "[" + _POSE_FMT % tuple(start_joints) + "]"
     
-    # Extract starting normal direction (tool X-axis)
-    starting_normal = [starting_rotation_matrix[0][0], starting_rotation_matrix[1][0], starting_rotation_matrix[2][0]]
+    # Starting orientation as a unit quaternion
+    q0 = _aa_to_quat(starting_rx, starting_ry, starting_rz)
 
     # Apply tilt inversion if requested
     if invert_tilt:
@@ -675,88 +800,51 @@ def spiral_cold_spray(
     # Determine if we're using variable cycle timing
     use_variable_cycle = cycle_s_start is not None and cycle_s_end is not None
 
-    # Build URScript
+    # Whole-spiral schedules as arrays (one NumPy pass instead of a per-step loop)
+    step = np.arange(total_steps + 1)
+    frac = step / total_steps if total_steps else np.ones(1)
+    phi_deg = (step / steps_per_rev) * 360.0 + phase_offset_deg  # Phase with optional offset
+
+    # Skip near 90° and 270° (wrap-safe)
+    ang = phi_deg % 360.0
+    keep = np.minimum(np.abs((ang - 90 + 180) % 360 - 180),
+                      np.abs((ang - 270 + 180) % 360 - 180)) >= sing_tol_deg
+    frac = frac[keep]
+    phi = np.radians(phi_deg[keep])
+
+    # Linear schedules (a constant tilt stays scalar so its trig runs once)
+    if tilt_start_deg == tilt_end_deg:
+        tilt = math.radians(tilt_start_deg)
+    else:
+        tilt = np.radians(tilt_start_deg + (tilt_end_deg - tilt_start_deg) * frac)
+    r = (r_start_mm + (r_end_mm - r_start_mm) * frac) / 1000.0
+    # Per-waypoint cycle times only when they vary; a constant goes in the servoj line
+    if use_variable_cycle:
+        cycle_times = cycle_s_start + (cycle_s_end - cycle_s_start) * frac
+    else:
+        cycle_times = "%.6f" % cycle_s
+
+    # Rotation axis perpendicular to starting normal, turning with the spiral phase.
+    # (0, cos φ, sin φ) is already unit length, so no normalization is needed.
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+    rotation_axes = np.stack([np.zeros_like(phi), cos_phi, sin_phi], axis=1)
+
+    # Tilt about each axis applied to the starting orientation (q_tilt ⊗ q0),
+    # converted straight to axis-angle for UR
+    aa = _tilted_aa_batch(q0, rotation_axes, tilt)
+
+    # Spiral translation in TCP YZ plane around current center
+    poses = np.column_stack([
+        np.full(phi.shape, x0),
+        y0 + r * cos_phi,
+        z0 + r * sin_phi,
+        aa,
+    ])
+
+    # Build URScript; the controller loops servoj over the pose (and cycle time) lists
     lines: List[str] = ["def spiral_servoj():"]
-
-    for step in range(total_steps + 1):
-        frac = step / total_steps if total_steps else 1.0
-        # Linear schedules
-        tilt = math.radians(tilt_start_deg + (tilt_end_deg - tilt_start_deg) * frac)
-        r_mm = r_start_mm + (r_end_mm - r_start_mm) * frac
-        r = r_mm / 1000.0
-        
-        # Calculate cycle time (variable or fixed)
-        if use_variable_cycle:
-            current_cycle_s = cycle_s_start + (cycle_s_end - cycle_s_start) * frac
-        else:
-            current_cycle_s = cycle_s
-
-        # Phase with optional offset
-        phi_deg = (step / steps_per_rev) * 360.0 + phase_offset_deg
-        phi = math.radians(phi_deg)
-
-        # Skip near 90° and 270° (wrap-safe)
-        ang = (phi_deg % 360.0)
-        if min(abs(((ang - 90) + 180) % 360 - 180),
-               abs(((ang - 270) + 180) % 360 - 180)) < sing_tol_deg:
-            continue
-
-        # Create orientation with linearly varying angle from starting normal direction
-        # Calculate target angle from starting normal (linearly interpolated)
-        current_tilt_angle_rad = math.radians(tilt_start_deg + (tilt_end_deg - tilt_start_deg) * frac)
-        
-        # Create rotation axis perpendicular to starting normal direction
-        # Use spiral phase to create varying rotation axis direction
-        rotation_axis = [
-            0.0,
-            math.cos(phi), 
-            math.sin(phi)
-        ]
-        
-        # Normalize rotation axis
-        axis_mag = math.sqrt(rotation_axis[0]*rotation_axis[0] + rotation_axis[1]*rotation_axis[1] + rotation_axis[2]*rotation_axis[2])
-        if axis_mag > 1e-6:
-            rotation_axis = [rotation_axis[0]/axis_mag, rotation_axis[1]/axis_mag, rotation_axis[2]/axis_mag]
-        else:
-            rotation_axis = [0.0, 1.0, 0.0]  # Default to Y-axis
-        
-        # Create rotation matrix for tilt around rotation_axis using Rodrigues formula
-        cos_tilt = math.cos(current_tilt_angle_rad)
-        sin_tilt = math.sin(current_tilt_angle_rad)
-        ax, ay, az = rotation_axis[0], rotation_axis[1], rotation_axis[2]
-        
-        R_tilt = [
-            [cos_tilt + ax*ax*(1-cos_tilt), ax*ay*(1-cos_tilt) - az*sin_tilt, ax*az*(1-cos_tilt) + ay*sin_tilt],
-            [ay*ax*(1-cos_tilt) + az*sin_tilt, cos_tilt + ay*ay*(1-cos_tilt), ay*az*(1-cos_tilt) - ax*sin_tilt],
-            [az*ax*(1-cos_tilt) - ay*sin_tilt, az*ay*(1-cos_tilt) + ax*sin_tilt, cos_tilt + az*az*(1-cos_tilt)]
-        ]
-        
-        # Apply rotation to starting orientation: target = R_tilt * starting_rotation_matrix
-        target_rotation_matrix = [
-            [0.0, 0.0, 0.0],
-            [0.0, 0.0, 0.0], 
-            [0.0, 0.0, 0.0]
-        ]
-        
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    target_rotation_matrix[i][j] += R_tilt[i][k] * starting_rotation_matrix[k][j]
-        
-        # Convert target rotation matrix to axis-angle for UR
-        rx, ry, rz = _mat_to_aa(target_rotation_matrix)
-
-        # Spiral translation in TCP YZ plane around current center
-        x = x0
-        y = y0 + r * math.cos(phi)
-        z = z0 + r * math.sin(phi)
-
-        pose_str = ", ".join(f"{v:.6f}" for v in [x, y, z, rx, ry, rz])
-        lines.append(
-            f"  servoj(get_inverse_kin(p[{pose_str}]), t={current_cycle_s:.6f}, lookahead_time={lookahead_s}, gain={gain})"
-        )
-        lines.append("  sync()")
-
+    lines += _servoj_loop(poses, cycle_times, lookahead_s, gain)
 
     lines.append("# Return to starting joint position")
     lines.append(f"movej({starting_joints_str}, a=1.0, v=1.0)")
@@ -765,6 +853,53 @@ def spiral_cold_spray(
     lines.append("")
     lines.append("spiral_servoj()")
     lines.append("")
-    
 
-    send_urscript(robot, "\n".join(lines))
+    return "\n".join(lines)
+
+def spiral_cold_spray(
+    robot: urx.Robot,
+    *,
+    tilt_start_deg: float,
+    tilt_end_deg: float,
+    revs: float,
+    r_start_mm: float,
+    r_end_mm: float,
+    steps_per_rev: int,
+    cycle_s: float,
+    lookahead_s: float,
+    gain: int,
+    sing_tol_deg: float,
+    phase_offset_deg: float = 0.0,
+    cycle_s_start: float = None,
+    cycle_s_end: float = None,
+    invert_tilt: bool = False,
+):
+    """Generate a radius-scheduled spiral and execute with servoj.
+
+    - Uses current TCP XYZ as spiral center and current orientation as starting reference.
+    - Keeps the singularity avoidance by skipping phases near 90°/270°.
+    - Creates orientations with linearly varying angle from starting normal direction:
+      tool X-axis angle varies linearly from tilt_start → tilt_end degrees.
+    - If cycle_s_start and cycle_s_end are provided, interpolates cycle time
+      from start to end over the whole spiral. Otherwise uses fixed cycle_s.
+    - If invert_tilt is True, negates both tilt angles to flip the tilt direction.
+    """
+    script = _build_spiral_script(
+        get_tcp_pose(robot),
+        robot.getj(),
+        tilt_start_deg=tilt_start_deg,
+        tilt_end_deg=tilt_end_deg,
+        revs=revs,
+        r_start_mm=r_start_mm,
+        r_end_mm=r_end_mm,
+        steps_per_rev=steps_per_rev,
+        cycle_s=cycle_s,
+        lookahead_s=lookahead_s,
+        gain=gain,
+        sing_tol_deg=sing_tol_deg,
+        phase_offset_deg=phase_offset_deg,
+        cycle_s_start=cycle_s_start,
+        cycle_s_end=cycle_s_end,
+        invert_tilt=invert_tilt,
+    )
+    send_urscript(robot, script)
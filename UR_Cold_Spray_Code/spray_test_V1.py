@@ -173,7 +173,7 @@ def _run_sweep(robot: urx.Robot, *, tilt: float, rev: float, cycle: float):
 # -----------------------------------------------------------------------------
 
 def main():
-    robot = urx.Robot(ROBOT_IP)
+    robot = rf.connect_robot(ROBOT_IP)
     try:
         # TCP offset
         rf.set_tcp_offset(robot, *TCP_OFFSET_MM)
@@ -201,8 +201,7 @@ def main():
         print("complete")
 
     finally:
-        robot.close()
-        print("✓ Robot connection closed")
+        rf.disconnect_robot(robot)
 
 
 if __name__ == "__main__":
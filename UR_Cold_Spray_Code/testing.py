@@ -2,7 +2,6 @@ import time
 import sys
 from typing import Optional
 import math
-import urx
 
 # Import our modules
 import robot_functions as rf
@@ -14,7 +13,7 @@ DEFAULT_WAIT_TIME = 30  # seconds to wait for program completion
 
 HOMETest = [math.radians(a) for a in [201.64, -54.86, 109.85, 214.57, 269.77, 111.69]]
 
-robot = urx.Robot(ROBOT_IP)
+robot = rf.connect_robot(ROBOT_IP)
 rf.set_tcp_offset(robot, -257.81, 0, 60.3, 0, 0, 0)
 # --- Move down, then MoveP back to home TCP 
 rf.move_to_joint_position(robot, HOMETest, acc=0.5, vel=0.5)
@@ -68,7 +67,7 @@ rf.conical_motion_servoj_script(
 time.sleep(1.3)
 rf.wait_until_idle(robot) 
 print("Complete")
-robot.close()
+rf.disconnect_robot(robot)
 
 
 # Align the tool to the spray pattern
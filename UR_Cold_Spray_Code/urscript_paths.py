@@ -1,16 +1,19 @@
 def onebyonesnake(acc: float = 0.1, vel: float = 0.1, blend_r: float = 0.001, iterations: int = 7):
     # Cold Spray script that goes right up left up right up etc. 
+    # Motion arguments are identical for every move, so format them once
+    move_args = f"a={acc}, v={vel}, r={blend_r}"
     return f"""
 def cold_spray():
-    # First loop - 7 iterations with downward Z movement
-    i = 0
+    j = 0
     while j < {iterations}:
+        # First loop - 7 iterations with downward Z movement
+        i = 0
         while i < 7:
-            movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
-            movel(pose_trans(get_actual_tcp_pose(), p[0, 0, -0.002, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
-            movel(pose_trans(get_actual_tcp_pose(), p[0, 0.0274, 0, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
+            movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), {move_args})
+            movel(pose_trans(get_actual_tcp_pose(), p[0, 0, -0.002, 0, 0, 0]), {move_args})
+            movel(pose_trans(get_actual_tcp_pose(), p[0, 0.0274, 0, 0, 0, 0]), {move_args})
             if i < 6:
-                movel(pose_trans(get_actual_tcp_pose(), p[0, 0, -0.002, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
+                movel(pose_trans(get_actual_tcp_pose(), p[0, 0, -0.002, 0, 0, 0]), {move_args})
             end
             i = i + 1
         end
@@ -18,12 +21,12 @@ def cold_spray():
         # Second loop - 7 iterations with upward Z movement
         i = 0
         while i < 7:
-            movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
-            movel(pose_trans(get_actual_tcp_pose(), p[0, 0, 0.002, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
+            movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), {move_args})
+            movel(pose_trans(get_actual_tcp_pose(), p[0, 0, 0.002, 0, 0, 0]), {move_args})
             
             if i < 6:
-                movel(pose_trans(get_actual_tcp_pose(), p[0, 0.0274, 0, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
-                movel(pose_trans(get_actual_tcp_pose(), p[0, 0, 0.002, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
+                movel(pose_trans(get_actual_tcp_pose(), p[0, 0.0274, 0, 0, 0, 0]), {move_args})
+                movel(pose_trans(get_actual_tcp_pose(), p[0, 0, 0.002, 0, 0, 0]), {move_args})
             end
             i = i + 1
         end
@@ -31,7 +34,7 @@ def cold_spray():
     end
     
     # Final extra left movement
-    movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), a={acc}, v={vel}, r={blend_r})
+    movel(pose_trans(get_actual_tcp_pose(), p[0, -0.0274, 0, 0, 0, 0]), {move_args})
 end
 
 cold_spray()
@@ -315,6 +315,9 @@ class HT301Stream:
             
             frame = self.capture.get_latest_frame()
             if frame is not None:
+                # get_latest_frame reuses its output buffers; the encode
+                # thread needs a frame the next render cannot overwrite
+                frame = frame.copy()
                 try:
                     self.frame_queue.put_nowait(frame)
                 except queue.Full: